@@ -0,0 +1,65 @@
+"""
+Runs the serialization benchmarks against a throwaway SQLite test database.
+
+    python -m benchmarks --sizes 1000 10000 --output results.json
+    python -m benchmarks --compare results.json
+
+With --compare, the exit status is 1 when any case got slower than the threshold.
+"""
+import argparse
+import json
+import os
+import sys
+
+import django
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument('--sizes', type=int, nargs='+', help='dataset sizes, in rows')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per case, the best one is kept')
+    parser.add_argument('--select', nargs='+', help='only run cases whose name contains one of these')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--compare', help='JSON results of a previous run to compare against')
+    parser.add_argument('--threshold', type=float, default=0.1, help='tolerated slowdown ratio')
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'serialization.settings')
+    django.setup()
+
+    from django.db import connection
+    from benchmarks.runner import compare, dump, run_benchmarks
+
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        report = run_benchmarks(args.sizes, args.repeat, args.select)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    for result in report['results']:
+        print(
+            f"{result['name']:<40} {result['size']:>8} rows "
+            f"{result['rows_per_second']:>12.0f} rows/s "
+            f"{result['peak_memory_bytes'] / 1024:>10.0f} KiB "
+            f"{result['queries'] if result['queries'] is not None else '-':>6} queries"
+        )
+
+    if args.output:
+        with open(args.output, 'w') as fp:
+            dump(report, fp)
+
+    if args.compare:
+        with open(args.compare) as fp:
+            regressions = compare(json.load(fp), report, args.threshold)
+
+        for regression in regressions:
+            print(f"REGRESSION {regression['name']} ({regression['size']} rows): {regression['ratio']:.2f}x")
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,129 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import async_to_sync
+from django.db import connection
+
+from benchmarks import fixtures
+from benchmarks.serializers import BasicSerializer, ChildSerializer, WideSerializer
+from serializer.tests.models import BasicModel, ModelChild, ModelSimpleParent, WideModel
+
+SERIALIZERS = {
+    'basic': BasicSerializer,
+    'child': ChildSerializer,
+    'wide': WideSerializer,
+}
+
+ROWS = {
+    'basic': fixtures.basic_rows,
+    'child': fixtures.child_rows,
+    'wide': fixtures.wide_rows,
+}
+
+CONCURRENT_REQUESTS = 8
+
+MODELS = {
+    'basic': [BasicModel],
+    'child': [ModelChild, ModelSimpleParent],
+    'wide': [WideModel],
+}
+
+
+def delete_all(models):
+    def setup():
+        for model in models:
+            model.objects.all().delete()
+
+    return setup
+
+
+def serialization_case(serializer_class, mode):
+    def run():
+        serializer_class().serialize(mode)
+
+    return {'run': run}
+
+
+def concurrent_async_case(serializer_class, mode, size, requests=CONCURRENT_REQUESTS):
+    async def serve():
+        await asyncio.gather(*[serializer_class().aserialize(mode) for _ in range(requests)])
+
+    def run():
+        async_to_sync(serve)()
+
+    return {'run': run, 'rows': size * requests}
+
+
+def concurrent_threads_case(serializer_class, mode, size, requests=CONCURRENT_REQUESTS):
+    def serve():
+        try:
+            serializer_class().serialize(mode)
+        finally:
+            connection.close()
+
+    def run():
+        with ThreadPoolExecutor(requests) as executor:
+            for future in [executor.submit(serve) for _ in range(requests)]:
+                future.result()
+
+    # Queries run on the pool's own connections, out of reach of the runner's query counter
+    return {'run': run, 'rows': size * requests, 'count_queries': False}
+
+
+def as_normal(serializer_class, row) -> dict:
+    data = dict(zip(serializer_class.fields, row))
+
+    for _, field in serializer_class.nested:
+        if data[field] is not None:
+            data[field] = as_normal(serializer_class.foo[field]['serializer']['class'], data[field])
+
+    return data
+
+
+def creation_case(serializer_class, mode, rows, models, **kwargs):
+    def payload():
+        if mode == 'split':
+            return {'model': list(serializer_class.fields), 'data': rows}
+
+        return [as_normal(serializer_class, row) for row in rows]
+
+    def run():
+        serializer_class().create(payload(), mode, **kwargs)
+
+    return {'run': run, 'setup': delete_all(models)}
+
+
+def get_cases(size):
+    """
+    Returns {case name: {'run': callable, 'setup': optional callable, 'rows': optional row count,
+    'count_queries': optional bool}} for a dataset of `size` rows.
+    Serialization cases expect the tables to be populated with `fixtures.populate(size)`.
+    """
+    cases = {}
+
+    for name, serializer_class in SERIALIZERS.items():
+        for mode in ['normal', 'split']:
+            cases[f'{name}.{mode}_serialization'] = serialization_case(serializer_class, mode)
+
+    # The same requests served by async views and by one thread per request
+    for mode in ['normal', 'split']:
+        cases[f'wide.{mode}_serialization.concurrent_async'] = concurrent_async_case(WideSerializer, mode, size)
+        cases[f'wide.{mode}_serialization.concurrent_threads'] = concurrent_threads_case(WideSerializer, mode, size)
+
+    for name, serializer_class in SERIALIZERS.items():
+        rows = ROWS[name](size)
+        models = MODELS[name]
+
+        for mode in ['normal', 'split']:
+            # Split creation only resolves nested payloads in bulk mode
+            if not (mode == 'split' and serializer_class.nested):
+                cases[f'{name}.{mode}_creation'] = creation_case(serializer_class, mode, rows, models)
+
+            cases[f'{name}.{mode}_creation.bulk'] = creation_case(
+                serializer_class, mode, rows, models, bulk=True
+            )
+
+        # COPY on PostgreSQL, a single prepared INSERT elsewhere
+        cases[f'{name}.split_creation.native'] = creation_case(serializer_class, 'split', rows, models, native=True)
+
+    return cases
@@ -0,0 +1,47 @@
+from serializer.tests.models import BasicModel, ModelChild, ModelSimpleParent, WideModel
+
+PARENTS = 50
+
+
+def clear():
+    ModelChild.objects.all().delete()
+    ModelSimpleParent.objects.all().delete()
+    BasicModel.objects.all().delete()
+    WideModel.objects.all().delete()
+
+
+def basic_rows(size):
+    return [[f'Basic{i}'] for i in range(size)]
+
+
+def child_rows(size):
+    return [[f'Child{i}', [f'Parent{i % PARENTS}']] for i in range(size)]
+
+
+def wide_rows(size):
+    return [
+        [
+            f'Name{i}', f'C{i % 1000}', f'Description of row {i}', f'Category{i % 10}',
+            i, i % 100, i % 7, 2000 + i % 20,
+            i * 1.5, i * 0.75, (i % 50) / 3, (i % 5) + 0.5,
+            i % 2 == 0, i % 10 == 0,
+        ]
+        for i in range(size)
+    ]
+
+
+def populate(size):
+    clear()
+
+    BasicModel.objects.bulk_create(BasicModel(name=row[0]) for row in basic_rows(size))
+
+    parents = ModelSimpleParent.objects.bulk_create(
+        ModelSimpleParent(name=f'Parent{i}') for i in range(PARENTS)
+    )
+    parent_ids = list(ModelSimpleParent.objects.order_by('pk').values_list('pk', flat=True))
+    ModelChild.objects.bulk_create(
+        ModelChild(name=f'Child{i}', related_id=parent_ids[i % len(parents)]) for i in range(size)
+    )
+
+    wide_fields = [field.name for field in WideModel._meta.concrete_fields if not field.primary_key]
+    WideModel.objects.bulk_create(WideModel(**dict(zip(wide_fields, row))) for row in wide_rows(size))
@@ -0,0 +1,118 @@
+import gc
+import json
+import platform
+import time
+import tracemalloc
+
+import django
+from django.db import connection
+
+from benchmarks import fixtures
+from benchmarks.cases import get_cases
+
+DEFAULT_SIZES = [1000, 10000]
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 0.1
+
+
+class QueryCounter:
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def measure(case, size, repeat=DEFAULT_REPEAT):
+    run = case['run']
+    setup = case.get('setup')
+
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    # Memory and queries are measured in a separate run, tracing slows the code down
+    if setup:
+        setup()
+
+    gc.collect()
+    query_counter = QueryCounter()
+    tracemalloc.start()
+    with connection.execute_wrapper(query_counter):
+        run()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    seconds = min(timings)
+    rows = case.get('rows', size)
+    return {
+        'size': size,
+        'seconds': seconds,
+        'rows_per_second': rows / seconds if seconds else None,
+        'peak_memory_bytes': peak_memory,
+        'queries': query_counter.count if case.get('count_queries', True) else None,
+    }
+
+
+def run_benchmarks(sizes=None, repeat=DEFAULT_REPEAT, select=None) -> dict:
+    results = []
+
+    for size in sizes or DEFAULT_SIZES:
+        cases = get_cases(size)
+        fixtures.populate(size)
+
+        # Serialization cases read the populated tables, so they run before the creation ones
+        for name in sorted(cases, key=lambda case_name: 'creation' in case_name):
+            if select and not any(pattern in name for pattern in select):
+                continue
+
+            result = measure(cases[name], size, repeat)
+            result['name'] = name
+            results.append(result)
+
+    fixtures.clear()
+
+    return {
+        'environment': {
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+        },
+        'results': results,
+    }
+
+
+def compare(previous: dict, current: dict, threshold=DEFAULT_THRESHOLD) -> list:
+    """
+    Returns the cases of `current` whose rows per second dropped by more than `threshold` (a ratio)
+    compared to the same case and size in `previous`.
+    """
+    previous_results = {(result['name'], result['size']): result for result in previous['results']}
+    regressions = []
+
+    for result in current['results']:
+        baseline = previous_results.get((result['name'], result['size']))
+        if not baseline or not baseline['rows_per_second'] or not result['rows_per_second']:
+            continue
+
+        ratio = result['rows_per_second'] / baseline['rows_per_second']
+        if ratio < 1 - threshold:
+            regressions.append({
+                'name': result['name'],
+                'size': result['size'],
+                'ratio': ratio,
+            })
+
+    return regressions
+
+
+def dump(report: dict, fp):
+    json.dump(report, fp, indent=2)
@@ -0,0 +1,33 @@
+from serializer import serializers
+from serializer.tests.models import BasicModel, ModelChild, ModelSimpleParent, WideModel
+
+
+class BasicSerializer(serializers.Serializer):
+    class Meta:
+        model = BasicModel
+        fields = ['name']
+
+
+class ParentSerializer(serializers.Serializer):
+    class Meta:
+        model = ModelSimpleParent
+        fields = ['name']
+
+
+class ChildSerializer(serializers.Serializer):
+    related = ParentSerializer
+
+    class Meta:
+        model = ModelChild
+        fields = ['name', 'related']
+
+
+class WideSerializer(serializers.Serializer):
+    class Meta:
+        model = WideModel
+        fields = [
+            'name', 'code', 'description', 'category',
+            'quantity', 'stock', 'position', 'year',
+            'price', 'cost', 'weight', 'rating',
+            'active', 'featured',
+        ]
@@ -0,0 +1,202 @@
+import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import caches
+from django.core.exceptions import EmptyResultSet
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+
+from serializer.serializers import post_bulk_create
+
+KEY_PREFIX = 'serializer'
+
+MISSING = object()
+
+
+class LocalCache:
+    """
+    In-process LRU with per-entry expiration, used when a serializer declares no `cache_alias`.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return default
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self.entries[key]
+                return default
+
+            self.entries.move_to_end(key)
+
+        return pickle.loads(value)
+
+    def set(self, key, value, timeout=None):
+        expires_at = None if timeout is None else time.monotonic() + timeout
+        # Kept pickled like in Django's cache backends, callers must never share the cached lists and dicts
+        value = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+        with self.lock:
+            self.entries[key] = (value, expires_at)
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+
+local_caches = {}
+stats = {}
+
+# Entries are never deleted on invalidation: every model has a generation that is part of the keys
+generations = {}
+tracked_models = set()
+aliases = set()
+
+
+def get_backend(serializer_class):
+    options = serializer_class.cache_options
+
+    if options['alias']:
+        return caches[options['alias']]
+
+    if serializer_class not in local_caches:
+        local_caches[serializer_class] = LocalCache(options['max_entries'])
+
+    return local_caches[serializer_class]
+
+
+def get_generation_key(model) -> str:
+    return f'{KEY_PREFIX}:generation:{model._meta.label}'
+
+
+def get_generations(serializer_class) -> tuple:
+    alias = serializer_class.cache_options['alias']
+
+    if alias:
+        keys = [get_generation_key(model) for model in serializer_class.related_models]
+        shared_generations = caches[alias].get_many(keys)
+        return tuple(shared_generations.get(key, 0) for key in keys)
+
+    return tuple(generations.get(model, 0) for model in serializer_class.related_models)
+
+
+def invalidate(model):
+    generations[model] = generations.get(model, 0) + 1
+
+    for alias in aliases:
+        key = get_generation_key(model)
+        try:
+            caches[alias].incr(key)
+        except ValueError:
+            caches[alias].set(key, 1, None)
+
+
+def invalidate_receiver(sender, **kwargs):
+    invalidate(sender)
+
+
+def track(serializer_class):
+    for model in serializer_class.related_models:
+        if model in tracked_models:
+            continue
+
+        # Connected per sender, a global receiver would disable Django's fast deletes for every model
+        dispatch_uid = f'{KEY_PREFIX}:{model._meta.label}'
+        post_save.connect(invalidate_receiver, sender=model, dispatch_uid=dispatch_uid)
+        post_delete.connect(invalidate_receiver, sender=model, dispatch_uid=dispatch_uid)
+        post_bulk_create.connect(invalidate_receiver, sender=model, dispatch_uid=dispatch_uid)
+
+        tracked_models.add(model)
+
+
+def register(serializer_class):
+    """
+    Called when a serializer class with `Meta.cache` is created, so that a process writing its models
+    invalidates the shared entries even if it never reads from the cache.
+    """
+    if serializer_class.cache_options['alias']:
+        aliases.add(serializer_class.cache_options['alias'])
+
+    track(serializer_class)
+
+
+def get_key(serializer, key_parts):
+    if not isinstance(serializer.data, QuerySet):
+        return None
+
+    try:
+        sql, params = serializer.data.query.sql_with_params()
+    except EmptyResultSet:
+        return None
+
+    serializer_class = type(serializer)
+    content = repr((key_parts, sql, params, get_generations(serializer_class)))
+    digest = hashlib.sha1(content.encode()).hexdigest()
+
+    return f'{KEY_PREFIX}:{serializer_class.__module__}.{serializer_class.__qualname__}:{digest}'
+
+
+def cached(serializer, key_parts, builder):
+    """
+    Returns the value cached for `serializer`'s queryset and `key_parts`, calling `builder` on a miss.
+    Serializers over anything but a QuerySet are not cached.
+    """
+    serializer_class = type(serializer)
+
+    key = get_key(serializer, key_parts)
+    if key is None:
+        return builder()
+
+    backend = get_backend(serializer_class)
+    counters = stats.setdefault(serializer_class, {'hits': 0, 'misses': 0})
+
+    value = backend.get(key, MISSING)
+    if value is not MISSING:
+        counters['hits'] += 1
+        return value
+
+    counters['misses'] += 1
+    value = builder()
+    backend.set(key, value, serializer_class.cache_options['timeout'])
+
+    return value
+
+
+def cache_info(serializer_class) -> dict:
+    counters = stats.get(serializer_class, {'hits': 0, 'misses': 0})
+    local_cache = local_caches.get(serializer_class)
+
+    return {
+        'hits': counters['hits'],
+        'misses': counters['misses'],
+        'entries': len(local_cache) if local_cache is not None else None,
+    }
+
+
+def forget(serializer_class):
+    local_caches.pop(serializer_class, None)
+    stats.pop(serializer_class, None)
+
+
+def clear(serializer_class):
+    stats.pop(serializer_class, None)
+
+    if serializer_class in local_caches:
+        local_caches[serializer_class].clear()
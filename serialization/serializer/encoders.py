@@ -0,0 +1,335 @@
+import json
+import mmap
+import os
+import struct
+from contextlib import contextmanager
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from serializer.serializers import DATA, DEFAULT_CHUNK_SIZE, MODEL, Record
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+BUFFER_SIZE = 64 * 1024
+
+
+class SerializerJSONEncoder(DjangoJSONEncoder):
+
+    def default(self, o):
+        if isinstance(o, Record):
+            return o.as_dict()
+
+        return super().default(o)
+
+
+JSON_ENCODER = SerializerJSONEncoder()
+
+# Packed format: the magic, then one value per row (the field list first in split mode), each one a
+# tag byte followed by its payload. Integers are zigzag varints, lengths and counts plain varints
+PACKED_MAGIC = b'DSP\x01'
+
+NONE_TAG = ord('N')
+TRUE_TAG = ord('T')
+FALSE_TAG = ord('F')
+INT_TAG = ord('i')
+FLOAT_TAG = ord('d')
+STR_TAG = ord('s')
+BYTES_TAG = ord('b')
+LIST_TAG = ord('l')
+DICT_TAG = ord('m')
+
+FLOAT_STRUCT = struct.Struct('<d')
+
+
+def encode_json(serializer, mode, chunk_size=DEFAULT_CHUNK_SIZE):
+    dumps = JSON_ENCODER.encode
+    rows = serializer.iter_serialize(mode, chunk_size)
+
+    if mode in ('normal', 'record'):
+        yield '['
+        end = ']'
+    elif mode == 'split':
+        fields = next(rows)
+        yield f'{{{dumps(MODEL)}: {dumps(fields)}, {dumps(DATA)}: ['
+        end = ']}'
+    else:
+        raise Exception(f'Mode ´{mode}´ can not be encoded')
+
+    separator = ''
+    for row in rows:
+        yield separator
+        yield dumps(row)
+        separator = ', '
+
+    yield end
+
+
+def encode_ndjson(serializer, mode, chunk_size=DEFAULT_CHUNK_SIZE):
+    dumps = JSON_ENCODER.encode
+
+    for row in serializer.iter_serialize(mode, chunk_size):
+        yield dumps(row)
+        yield '\n'
+
+
+def pack_value(value, out: bytearray):
+    if value is None:
+        out.append(NONE_TAG)
+    elif value is True:
+        out.append(TRUE_TAG)
+    elif value is False:
+        out.append(FALSE_TAG)
+    elif isinstance(value, int):
+        out.append(INT_TAG)
+        pack_varint(value << 1 if value >= 0 else (-value << 1) - 1, out)
+    elif isinstance(value, float):
+        out.append(FLOAT_TAG)
+        out += FLOAT_STRUCT.pack(value)
+    elif isinstance(value, str):
+        pack_sized(STR_TAG, value.encode(), out)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        pack_sized(BYTES_TAG, bytes(value), out)
+    elif isinstance(value, (list, tuple)):
+        out.append(LIST_TAG)
+        pack_varint(len(value), out)
+        for item in value:
+            pack_value(item, out)
+    elif isinstance(value, dict):
+        out.append(DICT_TAG)
+        pack_varint(len(value), out)
+        for key, item in value.items():
+            pack_value(key, out)
+            pack_value(item, out)
+    else:
+        # Dates, decimals and uuids travel as their JSON strings, like in the JSON formats
+        pack_value(JSON_ENCODER.default(value), out)
+
+
+def pack_sized(tag, data, out: bytearray):
+    out.append(tag)
+    pack_varint(len(data), out)
+    out += data
+
+
+def pack_varint(number, out: bytearray):
+    while number > 0x7f:
+        out.append(number & 0x7f | 0x80)
+        number >>= 7
+
+    out.append(number)
+
+
+def unpack_varint(buffer, offset) -> tuple:
+    number = 0
+    shift = 0
+
+    while True:
+        byte = buffer[offset]
+        offset += 1
+        number |= (byte & 0x7f) << shift
+
+        if byte < 0x80:
+            return number, offset
+
+        shift += 7
+
+
+def unpack_value(buffer, offset) -> tuple:
+    tag = buffer[offset]
+    offset += 1
+
+    if tag == NONE_TAG:
+        return None, offset
+    if tag == TRUE_TAG:
+        return True, offset
+    if tag == FALSE_TAG:
+        return False, offset
+    if tag == FLOAT_TAG:
+        return FLOAT_STRUCT.unpack_from(buffer, offset)[0], offset + FLOAT_STRUCT.size
+
+    length, offset = unpack_varint(buffer, offset)
+
+    if tag == INT_TAG:
+        return length >> 1 if not length & 1 else -((length + 1) >> 1), offset
+
+    if tag == STR_TAG:
+        return str(buffer[offset:offset + length], 'utf-8'), offset + length
+    if tag == BYTES_TAG:
+        return bytes(buffer[offset:offset + length]), offset + length
+    if tag == LIST_TAG:
+        items = []
+        for _ in range(length):
+            item, offset = unpack_value(buffer, offset)
+            items.append(item)
+        return items, offset
+    if tag == DICT_TAG:
+        items = {}
+        for _ in range(length):
+            key, offset = unpack_value(buffer, offset)
+            items[key], offset = unpack_value(buffer, offset)
+        return items, offset
+
+    raise Exception(f'Invalid packed data, unknown tag at offset {offset - 1}')
+
+
+def encode_packed(serializer, mode, chunk_size=DEFAULT_CHUNK_SIZE):
+    yield PACKED_MAGIC
+
+    for row in serializer.iter_serialize(mode, chunk_size):
+        out = bytearray()
+        pack_value(row, out)
+        yield bytes(out)
+
+
+def iter_packed_values(buffer):
+    if bytes(buffer[:len(PACKED_MAGIC)]) != PACKED_MAGIC:
+        raise Exception('Invalid packed data, missing header')
+
+    offset = len(PACKED_MAGIC)
+    size = len(buffer)
+
+    while offset < size:
+        value, offset = unpack_value(buffer, offset)
+        yield value
+
+
+def encode_msgpack(serializer, mode, chunk_size=DEFAULT_CHUNK_SIZE):
+    packer = msgpack.Packer(default=JSON_ENCODER.default)
+
+    for row in serializer.iter_serialize(mode, chunk_size):
+        yield packer.pack(row)
+
+
+def iter_ndjson_values(fp):
+    for line in fp:
+        if line.strip():
+            yield json.loads(line)
+
+
+def assemble(values, mode):
+    # Streamed formats carry one value per row, the field list first in split mode
+    if mode == 'split':
+        return {
+            MODEL: next(values, None),
+            DATA: values
+        }
+
+    return list(values)
+
+
+def decode_json(fp, mode):
+    return json.load(fp)
+
+
+def decode_ndjson(fp, mode):
+    return assemble(iter_ndjson_values(fp), mode)
+
+
+def decode_packed(fp, mode):
+    return assemble(iter_packed_values(fp.read()), mode)
+
+
+def decode_msgpack(fp, mode):
+    return assemble(iter(msgpack.Unpacker(fp, raw=False)), mode)
+
+
+def read_ndjson(buffer):
+    return iter_ndjson_values(iter(buffer.readline, b''))
+
+
+def read_msgpack(buffer):
+    return iter(msgpack.Unpacker(buffer, raw=False))
+
+
+ENCODERS = {}
+
+
+def register_encoder(format, encoder, content_type, decoder=None, reader=None):
+    """
+    Makes `format` available to dump, streaming_response and load. `encoder(serializer, mode, chunk_size)`
+    yields str or bytes pieces, `decoder(fp, mode)` returns the payload `create(payload, mode)` expects and
+    `reader(buffer)` yields the rows of a memory-mapped file one at a time, for `create_from_file`.
+    """
+    ENCODERS[format] = {
+        'encoder': encoder,
+        'content_type': content_type,
+        'decoder': decoder,
+        'reader': reader,
+    }
+
+
+register_encoder('json', encode_json, 'application/json', decode_json)
+register_encoder('ndjson', encode_ndjson, 'application/x-ndjson', decode_ndjson, read_ndjson)
+register_encoder('packed', encode_packed, 'application/octet-stream', decode_packed, iter_packed_values)
+
+if msgpack is not None:
+    register_encoder('msgpack', encode_msgpack, 'application/msgpack', decode_msgpack, read_msgpack)
+
+# The most compact binary format available
+BINARY_FORMAT = 'msgpack' if msgpack is not None else 'packed'
+
+
+def get_encoder(format) -> dict:
+    if format not in ENCODERS:
+        raise Exception(f'Invalid format ´{format}´')
+
+    return ENCODERS[format]
+
+
+def decode(fp, mode='split', format='json'):
+    decoder = get_encoder(format)['decoder']
+    if decoder is None:
+        raise Exception(f'Format ´{format}´ can not be decoded')
+
+    return decoder(fp, mode)
+
+
+@contextmanager
+def read_file(path, format='ndjson'):
+    reader = get_encoder(format)['reader']
+    if reader is None:
+        raise Exception(f'Format ´{format}´ can not be read incrementally')
+
+    with open(path, 'rb') as fp:
+        # Empty files can not be mapped
+        if os.fstat(fp.fileno()).st_size == 0:
+            yield iter(())
+            return
+
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield reader(buffer)
+
+
+def buffered(pieces, buffer_size=BUFFER_SIZE):
+    buffer = []
+    size = 0
+
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+
+        if size >= buffer_size:
+            yield piece[:0].join(buffer)
+            buffer = []
+            size = 0
+
+    if buffer:
+        yield buffer[0][:0].join(buffer)
+
+
+def encode(serializer, mode, format='json', chunk_size=DEFAULT_CHUNK_SIZE, buffer_size=BUFFER_SIZE):
+    encoder = get_encoder(format)['encoder']
+    return buffered(encoder(serializer, mode, chunk_size), buffer_size)
+
+
+def encode_all(serializer, mode, format='json', chunk_size=DEFAULT_CHUNK_SIZE):
+    pieces = list(get_encoder(format)['encoder'](serializer, mode, chunk_size))
+
+    # Streamed formats yield nothing for an empty table, there is no piece to tell str from bytes
+    if not pieces:
+        return None
+
+    return pieces[0][:0].join(pieces)
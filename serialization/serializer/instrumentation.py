@@ -0,0 +1,151 @@
+from collections import defaultdict
+from contextlib import contextmanager
+from time import perf_counter
+
+from django.db import connections
+from django.db.models import QuerySet
+
+
+class Profile:
+    """
+    Wall time per phase and per field, rows read and queries run while a serializer is profiled.
+    'fetch', 'create_related.<field>' and the hooks are part of the 'serialize' and 'create' phases.
+    """
+
+    def __init__(self):
+        self.phases = defaultdict(float)
+        self.hooks = defaultdict(float)
+        self.rows = 0
+        self.queries = 0
+        self.query_time = 0.0
+
+    def execute(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.query_time += perf_counter() - started
+
+    @contextmanager
+    def timing(self, phase):
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[phase] += perf_counter() - started
+
+    def iter_timed(self, phase, iterable, count_rows=False):
+        phases = self.phases
+        iterator = iter(iterable)
+
+        while True:
+            started = perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                phases[phase] += perf_counter() - started
+                return
+
+            phases[phase] += perf_counter() - started
+            if count_rows:
+                self.rows += 1
+
+            yield item
+
+    def timed_phase(self, phase, function):
+        return timed(self.phases, phase, function)
+
+    def timed_hook(self, field, function):
+        return timed(self.hooks, field, function)
+
+    def report(self) -> dict:
+        return {
+            'phases': dict(self.phases),
+            'hooks': dict(self.hooks),
+            'rows': self.rows,
+            'queries': self.queries,
+            'query_time': self.query_time,
+        }
+
+
+def timed(timings, key, function):
+    def call(*args, **kwargs):
+        started = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            timings[key] += perf_counter() - started
+
+    return call
+
+
+def get_using(serializer) -> str:
+    if isinstance(serializer.data, QuerySet):
+        return serializer.data.db
+
+    return serializer.model.objects.db
+
+
+def get_callback(serializer):
+    return serializer.instrument if callable(serializer.instrument) else None
+
+
+@contextmanager
+def profiling(serializer, callback=None):
+    # Calls made while a profile is active add to it, the outermost one publishes the report
+    if serializer.active_profile is not None:
+        yield serializer.active_profile
+        return
+
+    profile = Profile()
+    serializer.active_profile = profile
+    # Related serializers are wrapped while profiling, they are built again afterwards
+    serializer.related_serializers = {}
+
+    try:
+        with connections[get_using(serializer)].execute_wrapper(profile.execute):
+            yield profile
+    finally:
+        serializer.active_profile = None
+        serializer.related_serializers = {}
+        serializer.last_report = profile.report()
+
+        if callback is not None:
+            callback(serializer.last_report)
+
+
+def profiled(serializer, phase, function):
+    def call():
+        with profiling(serializer, get_callback(serializer)) as profile:
+            with profile.timing(phase):
+                return function()
+
+    return call
+
+
+def iter_profiled(serializer, phase, rows):
+    with profiling(serializer, get_callback(serializer)) as profile:
+        yield from profile.iter_timed(phase, rows)
+
+
+def delegated(serializer, delegate, function):
+    # `delegate` serializes on behalf of `serializer`, like a sparse serializer does, and adds to its profile
+    def call():
+        with profiling(serializer, get_callback(serializer)) as profile:
+            delegate.active_profile = profile
+            try:
+                return function()
+            finally:
+                delegate.active_profile = None
+
+    return call
+
+
+def iter_delegated(serializer, delegate, function):
+    with profiling(serializer, get_callback(serializer)) as profile:
+        delegate.active_profile = profile
+        try:
+            yield from function()
+        finally:
+            delegate.active_profile = None
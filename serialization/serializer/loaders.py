@@ -0,0 +1,113 @@
+import io
+
+from django.db.models import AutoField
+
+COPY_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '\t': '\\t',
+    '\n': '\\n',
+    '\r': '\\r',
+})
+
+
+def iter_insert_groups(model, instances):
+    """
+    Yields (fields, instances) for the instances with a primary key and for the others, which leave auto
+    primary keys to the database, like bulk_create does.
+    """
+    if model._meta.parents:
+        raise Exception('Native loading can not insert into multi-table inherited models')
+
+    fields = model._meta.concrete_fields
+    with_pks = [instance for instance in instances if instance.pk is not None]
+    without_pks = [instance for instance in instances if instance.pk is None]
+
+    if with_pks:
+        yield fields, with_pks
+
+    if without_pks:
+        yield [field for field in fields if not isinstance(field, AutoField)], without_pks
+
+
+def get_columns(connection, fields) -> str:
+    return ', '.join(connection.ops.quote_name(field.column) for field in fields)
+
+
+def prepare_row(fields, instance, connection) -> tuple:
+    # pre_save fills auto_now fields and the like, as the ORM insert does
+    return tuple(field.get_db_prep_save(field.pre_save(instance, True), connection=connection) for field in fields)
+
+
+def executemany_loader(model, connection, instances) -> list:
+    table = connection.ops.quote_name(model._meta.db_table)
+
+    for fields, group in iter_insert_groups(model, instances):
+        placeholders = ', '.join(['%s'] * len(fields))
+        sql = f'INSERT INTO {table} ({get_columns(connection, fields)}) VALUES ({placeholders})'
+
+        rows = [prepare_row(fields, instance, connection) for instance in group]
+
+        # One statement prepared once and run for every row of the batch
+        with connection.cursor() as cursor:
+            cursor.executemany(sql, rows)
+
+    return instances
+
+
+def to_copy_text(value) -> str:
+    if value is None:
+        return '\\N'
+
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return '\\\\x' + bytes(value).hex()
+
+    # psycopg2 adapters, like the ones wrapping json and binary values
+    if hasattr(value, 'adapted'):
+        if hasattr(value, 'dumps'):
+            return to_copy_text(value.dumps(value.adapted))
+
+        return to_copy_text(value.adapted)
+
+    if isinstance(value, (list, tuple, dict)):
+        raise Exception(f'Native loading can not copy ´{type(value).__name__}´ values')
+
+    return str(value).translate(COPY_ESCAPES)
+
+
+def copy_loader(model, connection, instances) -> list:
+    table = connection.ops.quote_name(model._meta.db_table)
+
+    for fields, group in iter_insert_groups(model, instances):
+        sql = f'COPY {table} ({get_columns(connection, fields)}) FROM STDIN'
+
+        buffer = io.StringIO()
+        for instance in group:
+            buffer.write('\t'.join(to_copy_text(value) for value in prepare_row(fields, instance, connection)))
+            buffer.write('\n')
+
+        with connection.cursor() as cursor:
+            if hasattr(cursor, 'copy_expert'):
+                buffer.seek(0)
+                cursor.copy_expert(sql, buffer)
+            else:
+                with cursor.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
+
+    return instances
+
+
+LOADERS = {
+    'postgresql': copy_loader,
+    'sqlite': executemany_loader,
+}
+
+
+def get_loader(connection):
+    """
+    The fastest way `connection`'s database has to insert many rows, as a `loader(model, connection, instances)`.
+    Primary keys are not set on the instances.
+    """
+    return LOADERS.get(connection.vendor, executemany_loader)
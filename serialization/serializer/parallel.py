@@ -0,0 +1,114 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import chain
+
+from django import setup
+from django.apps import apps
+from django.db import connections
+from django.db.models import Max, Min, QuerySet
+
+from serializer.serializers import DATA, MODEL
+
+PARTITIONS_PER_WORKER = 4
+
+
+def init_worker():
+    # Workers started with `spawn` (the macOS and Windows default) begin without a configured Django
+    if not apps.ready:
+        setup()
+
+
+def serialize_partition(serializer_class, selection, mode, query) -> list:
+    if selection is not None:
+        serializer_class = serializer_class.get_selection_class(selection)
+
+    queryset = serializer_class.model.objects.all()
+    queryset.query = query
+
+    rows = serializer_class(queryset).iter_serialize(mode)
+    if mode == 'split':
+        next(rows)
+
+    return list(rows)
+
+
+def get_partitions(queryset, count) -> list:
+    bounds = queryset.aggregate(low=Min('pk'), high=Max('pk'))
+    low, high = bounds['low'], bounds['high']
+
+    if low is None:
+        return []
+
+    if not isinstance(low, int):
+        raise Exception('Parallel serialization requires an integer primary key')
+
+    step = -(-(high - low + 1) // count)
+    return [queryset.filter(pk__gte=start, pk__lt=start + step) for start in range(low, high + 1, step)]
+
+
+def is_pk_descending(queryset) -> bool:
+    # Partitions are pk ranges, so they can only be merged in the queryset's order when it is the pk's
+    query = queryset.query
+    ordering = query.order_by or (query.default_ordering and queryset.model._meta.ordering) or ()
+    pk = queryset.model._meta.pk
+
+    if not ordering:
+        return False
+
+    if len(ordering) == 1 and isinstance(ordering[0], str) and ordering[0].lstrip('-') in ('pk', pk.name, pk.attname):
+        return ordering[0].startswith('-')
+
+    raise Exception('Ordered parallel serialization requires a QuerySet ordered by its primary key')
+
+
+def iter_parallel_serialize(serializer, mode, workers=None, ordered=True):
+    if not hasattr(serializer, f'iter_{mode}_serialization'):
+        raise Exception('Invalid serialization mode')
+
+    queryset = serializer.data
+    if not isinstance(queryset, QuerySet):
+        raise Exception('Parallel serialization requires a QuerySet')
+
+    if queryset.query.is_sliced:
+        raise Exception('Parallel serialization can not partition a sliced QuerySet')
+
+    connection = connections[queryset.db]
+    if connection.in_atomic_block:
+        raise Exception('Parallel serialization can not run inside a transaction, workers would not see it')
+
+    descending = ordered and is_pk_descending(queryset)
+
+    workers = workers or os.cpu_count()
+    queries = [partition.query for partition in get_partitions(queryset, workers * PARTITIONS_PER_WORKER)]
+    if descending:
+        queries.reverse()
+
+    # Forked workers must not share the parent's database connections, they open their own
+    connections.close_all()
+
+    # Sparse classes can not be found by name in the workers, they are sent as their base and selection
+    serializer_class = type(serializer)
+    if serializer_class.sparse_base is not None:
+        serializer_class, selection = serializer_class.sparse_base, serializer_class.sparse_selection
+    else:
+        selection = None
+
+    with ProcessPoolExecutor(workers, initializer=init_worker) as executor:
+        futures = [
+            executor.submit(serialize_partition, serializer_class, selection, mode, query) for query in queries
+        ]
+
+        for future in futures if ordered else as_completed(futures):
+            yield future.result()
+
+
+def parallel_serialize(serializer, mode, workers=None, ordered=True):
+    all_obj_data = list(chain.from_iterable(iter_parallel_serialize(serializer, mode, workers, ordered)))
+
+    if mode == 'split':
+        return {
+            MODEL: serializer.fields,
+            DATA: all_obj_data
+        }
+
+    return all_obj_data
@@ -1,6 +1,32 @@
+import base64
+import json
+import threading
+from array import array
 from builtins import print
-from collections import Iterable
-from itertools import chain
+from collections import OrderedDict
+from collections.abc import Iterable
+from functools import lru_cache, partial
+from itertools import chain, islice
+from operator import attrgetter
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, transaction
+from django.db.models import AutoField, Field, Max, Q, QuerySet
+from django.dispatch import Signal
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@lru_cache(maxsize=None)
+def get_model_field_index(model) -> dict:
+    # Built once per model and shared by every serializer declared for it
+    model_meta = model._meta
+    return {field.name: field for field in chain(model_meta.concrete_fields, model_meta.private_fields)}
 
 
 class SerializerMeta(type):
@@ -19,6 +45,29 @@ class SerializerMeta(type):
         setattr(new_class, 'model', model)
         setattr(new_class, 'fields', fields)
         setattr(new_class, 'foo', foo)
+        setattr(new_class, 'model_fields', tuple(get_model_field_index(model).values()) if model else ())
+        setattr(new_class, 'attnames', mcs._get_attnames(fields, foo))
+        setattr(new_class, 'row_getter', staticmethod(mcs._get_row_getter(fields, foo)))
+        setattr(new_class, 'representations', mcs._get_representations(fields, foo))
+        setattr(new_class, 'batch_representations', mcs._get_batch_representations(fields, foo))
+        setattr(new_class, 'memoize_size', mcs._get_memoize_size(meta))
+        setattr(new_class, 'nested', mcs._get_nested(fields, foo))
+        setattr(new_class, 'select_related', mcs._get_select_related(fields, foo))
+        setattr(new_class, 'only_paths', mcs._get_only_paths(fields, foo))
+        setattr(new_class, 'sparse_classes', OrderedDict())
+        setattr(new_class, 'column_types', mcs._get_column_types(fields, foo))
+        setattr(new_class, 'related_models', mcs._get_related_models(model, fields, foo))
+        setattr(new_class, 'cache_options', mcs._get_cache_options(meta))
+        setattr(new_class, 'key_fields', getattr(meta, 'key_fields', None))
+        setattr(new_class, 'watermark', getattr(meta, 'watermark', None))
+        setattr(new_class, 'validators', mcs._get_validators(fields, foo))
+        setattr(new_class, 'instrument', getattr(meta, 'instrument', False))
+        setattr(new_class, 'record_class', mcs._get_record_class(new_class, name, fields))
+
+        if new_class.cache_options:
+            from serializer.cache import register
+
+            register(new_class)
 
         return new_class
 
@@ -42,16 +91,212 @@ class SerializerMeta(type):
 
         return foo
 
+    @classmethod
+    def _get_attnames(mcs, fields, foo):
+        if not foo or mcs._get_nested(fields, foo):
+            return None
+
+        return mcs._get_value_names(fields, foo)
+
+    @classmethod
+    def _get_value_names(mcs, fields, foo):
+        # Nested serializers read the related instance itself instead of its key
+        value_names = []
+
+        for field in fields:
+            model_field = foo[field]['model_field']
+
+            if foo[field]['serializer']['class']:
+                value_names.append(model_field.name)
+            elif mcs._is_plain_field(model_field):
+                value_names.append(model_field.attname)
+            else:
+                return None
+
+        return tuple(value_names)
+
+    @staticmethod
+    def _is_plain_field(model_field):
+        return getattr(type(model_field), 'value_from_object', None) is Field.value_from_object
+
+    @classmethod
+    def _get_row_getter(mcs, fields, foo):
+        if not foo:
+            return None
+
+        value_names = mcs._get_value_names(fields, foo)
+
+        if value_names is None:
+            value_getters = tuple(
+                attrgetter(foo[field]['model_field'].name) if foo[field]['serializer']['class']
+                else foo[field]['model_field'].value_from_object
+                for field in fields
+            )
+            return lambda instance: tuple(value_getter(instance) for value_getter in value_getters)
+
+        getter = attrgetter(*value_names)
+
+        if len(value_names) == 1:
+            return lambda instance: (getter(instance),)
+
+        return getter
+
+    @classmethod
+    def _get_representations(mcs, fields, foo):
+        if not foo:
+            return ()
+
+        return tuple(
+            (index, foo[field]['representation'])
+            for index, field in enumerate(fields)
+            if foo[field]['representation'] and not getattr(foo[field]['representation'], 'batch', False)
+        )
+
+    @classmethod
+    def _get_batch_representations(mcs, fields, foo):
+        if not foo:
+            return ()
+
+        return tuple(
+            (index, foo[field]['representation'])
+            for index, field in enumerate(fields)
+            if getattr(foo[field]['representation'], 'batch', False)
+        )
+
+    @staticmethod
+    def _get_memoize_size(meta):
+        memoize = getattr(meta, 'memoize_representations', False)
+
+        if memoize is True:
+            return DEFAULT_MEMOIZE_SIZE
+
+        return memoize or None
+
+    @classmethod
+    def _get_nested(mcs, fields, foo):
+        if not foo:
+            return ()
+
+        return tuple(
+            (index, field)
+            for index, field in enumerate(fields)
+            if foo[field]['serializer']['class']
+        )
+
+    @classmethod
+    def _get_select_related(mcs, fields, foo):
+        select_related = []
+
+        for _, field in mcs._get_nested(fields, foo):
+            select_related.append(field)
+            select_related.extend(
+                f'{field}__{related_lookup}'
+                for related_lookup in foo[field]['serializer']['class'].select_related
+            )
+
+        return tuple(select_related)
+
+    @classmethod
+    def _get_only_paths(mcs, fields, foo):
+        # Columns to load when instances are needed, None when a field may read undeclared attributes
+        if not foo or mcs._get_value_names(fields, foo) is None:
+            return None
+
+        only_paths = []
+
+        for field in fields:
+            only_paths.append(foo[field]['model_field'].name)
+
+            serializer_related = foo[field]['serializer']['class']
+            if serializer_related:
+                if serializer_related.only_paths is None:
+                    return None
+
+                only_paths.extend(f'{field}__{path}' for path in serializer_related.only_paths)
+
+        return tuple(only_paths)
+
+    @classmethod
+    def _get_column_types(mcs, fields, foo):
+        if not foo:
+            return ()
+
+        return tuple(mcs._get_column_type(foo[field]) for field in fields)
+
+    @staticmethod
+    def _get_column_type(field_foo):
+        model_field = field_foo['model_field']
+
+        if field_foo['representation'] or field_foo['serializer']['class'] or model_field.null:
+            return None
+
+        if model_field.is_relation:
+            model_field = model_field.target_field
+
+        return COLUMN_TYPECODES.get(model_field.get_internal_type())
+
+    @classmethod
+    def _get_related_models(mcs, model, fields, foo):
+        if not model:
+            return ()
+
+        related_models = [model]
+
+        for _, field in mcs._get_nested(fields, foo):
+            for related_model in foo[field]['serializer']['class'].related_models:
+                if related_model not in related_models:
+                    related_models.append(related_model)
+
+        return tuple(related_models)
+
+    @staticmethod
+    def _get_cache_options(meta):
+        if not getattr(meta, 'cache', False):
+            return None
+
+        return {
+            'timeout': getattr(meta, 'cache_timeout', DEFAULT_CACHE_TIMEOUT),
+            'max_entries': getattr(meta, 'cache_max_entries', DEFAULT_CACHE_MAX_ENTRIES),
+            'alias': getattr(meta, 'cache_alias', None),
+        }
+
+    @classmethod
+    def _get_validators(mcs, fields, foo):
+        if not foo:
+            return ()
+
+        validators = []
+
+        for field in fields:
+            model_field = foo[field]['model_field']
+            serializer_related = foo[field]['serializer']['class']
+
+            if serializer_related:
+                validators.append(compile_nested_validator(serializer_related, model_field.null))
+            else:
+                validators.append(compile_validator(model_field))
+
+        return tuple(validators)
+
+    @staticmethod
+    def _get_record_class(serializer_class, name, fields):
+        if not fields:
+            return None
+
+        return type(f'{name}Record', (Record,), {
+            '__slots__': tuple(fields),
+            '_fields': tuple(fields),
+            '_serializer': serializer_class,
+        })
+
     @classmethod
     def _get_model_field(mcs, model, field_name):
-        model_meta = model._meta
-        model_fields = list(model_meta.concrete_fields) + list(model_meta.private_fields)   # EveryTime
+        model_field_index = get_model_field_index(model)
 
-        for field in model_fields:
-            if field.name == field_name:
-                return field
+        if field_name not in model_field_index:
+            raise Exception(f'{field_name} does not reference a field of {model}')
 
-        raise Exception(f'{field_name} does not reference a field of {model}')
+        return model_field_index[field_name]
 
     @classmethod
     def _get_serializer_fields(mcs, fields, values):
@@ -77,13 +322,257 @@ class SerializerMeta(type):
 
 MODEL = 'model'
 DATA = 'data'
+COLUMNS = 'columns'
+WATERMARK = 'watermark'
+REMOVED = 'removed'
+DICTIONARY = 'dictionary'
+
+INTEGER_TYPECODE = 'q'
+FLOAT_TYPECODE = 'd'
+BOOLEAN_TYPECODE = 'b'
+
+COLUMN_TYPECODES = {
+    'AutoField': INTEGER_TYPECODE,
+    'BigAutoField': INTEGER_TYPECODE,
+    'SmallAutoField': INTEGER_TYPECODE,
+    'IntegerField': INTEGER_TYPECODE,
+    'BigIntegerField': INTEGER_TYPECODE,
+    'SmallIntegerField': INTEGER_TYPECODE,
+    'PositiveIntegerField': INTEGER_TYPECODE,
+    'PositiveSmallIntegerField': INTEGER_TYPECODE,
+    'FloatField': FLOAT_TYPECODE,
+    'BooleanField': BOOLEAN_TYPECODE,
+}
+
+NUMPY_DTYPES = {
+    INTEGER_TYPECODE: 'int64',
+    FLOAT_TYPECODE: 'float64',
+    BOOLEAN_TYPECODE: 'bool',
+}
+
+# Sent with sender=model after a bulk write, which Django does not report through post_save
+post_bulk_create = Signal()
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_CHUNK_SIZE = 2000
+DEFAULT_CACHE_TIMEOUT = 300
+DEFAULT_CACHE_MAX_ENTRIES = 1000
+DEFAULT_MEMOIZE_SIZE = 1024
+DEFAULT_PAGE_SIZE = 100
+# Keys per lookup query, below the parameter and expression depth limits of SQLite
+KEY_LOOKUP_SIZE = 500
+MAX_SPARSE_CLASSES = 128
+
+# Reentrant, sparse classes of nested serializers are built while building their parent's
+sparse_lock = threading.RLock()
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+
+        yield chunk
+
+
+class InvalidData(Exception):
+
+    def __init__(self, errors):
+        self.errors = errors
+
+        details = '; '.join(f"row {error['row']}, ´{error['field']}´: {error['message']}" for error in errors[:10])
+        super().__init__(f'Invalid Data, {len(errors)} errors: {details}')
+
+
+class Record:
+    """
+    Base of the `__slots__` classes generated per serializer for the record mode, a row without a per-row dict.
+    Fields may shadow the methods, so the methods call each other through the base class.
+    """
+    __slots__ = ()
+    _fields = ()
+    _serializer = None
+
+    def __init__(self, *values):
+        for field, value in zip(self._fields, values):
+            setattr(self, field, value)
+
+    def keys(self):
+        return self._fields
+
+    def __getitem__(self, field):
+        if field not in self._fields:
+            raise KeyError(field)
+
+        return getattr(self, field)
+
+    def values(self) -> list:
+        return [getattr(self, field) for field in self._fields]
+
+    def as_dict(self) -> dict:
+        return {
+            field: value.as_dict() if isinstance(value, Record) else value
+            for field, value in zip(self._fields, Record.values(self))
+        }
+
+    def __eq__(self, other):
+        return type(self) is type(other) and Record.values(self) == Record.values(other)
+
+    def __repr__(self):
+        items = ', '.join(f'{field}={value!r}' for field, value in zip(self._fields, Record.values(self)))
+        return f'{type(self).__name__}({items})'
+
+    def __reduce__(self):
+        # Generated classes can not be found by name, they are rebuilt from their serializer, sparse ones
+        # from the serializer they narrow and their selection
+        serializer_class = self._serializer
+        values = tuple(Record.values(self))
+
+        if serializer_class.sparse_base is not None:
+            return build_record, (serializer_class.sparse_base, values, serializer_class.sparse_selection)
+
+        return build_record, (serializer_class, values)
+
+
+def build_record(serializer_class, values, selection=None):
+    if selection is not None:
+        serializer_class = serializer_class.get_selection_class(selection)
+
+    return serializer_class.record_class(*values)
+
+
+def get_error_message(error) -> str:
+    if isinstance(error, ValidationError):
+        return ' '.join(error.messages)
+
+    return str(error)
+
+
+def compile_validator(model_field):
+    to_python = model_field.to_python
+    # Auto-assigned primary keys are filled by the database when left empty
+    null = model_field.null or isinstance(model_field, AutoField)
+    max_length = model_field.max_length
+    choices = {choice for choice, _ in model_field.flatchoices} if model_field.choices else None
+
+    def validate(value):
+        if value is None:
+            if not null:
+                raise ValueError('This field cannot be null.')
+
+            return None
+
+        value = to_python(value)
+
+        if max_length is not None and len(value) > max_length:
+            raise ValueError(f'Ensure this value has at most {max_length} characters (it has {len(value)}).')
+
+        if choices is not None and value not in choices:
+            raise ValueError(f'Value {value!r} is not a valid choice.')
+
+        return value
+
+    return validate
+
+
+def compile_nested_validator(serializer_class, null):
+    def validate(payload):
+        if payload is None:
+            if not null:
+                raise ValueError('This field cannot be null.')
+
+            return None
+
+        if isinstance(payload, dict):
+            if list(payload.keys()) != serializer_class.fields:
+                raise ValueError('Keys must be the model fields')
+
+            values, errors = serializer_class.validate_values(list(payload.values()))
+        else:
+            values, errors = serializer_class.validate_values(payload)
+
+        if errors:
+            raise ValueError('; '.join(f'{field}: {message}' for field, message in errors))
+
+        return dict(zip(serializer_class.fields, values)) if isinstance(payload, dict) else values
+
+    return validate
+
+
+def memoized_representation(maxsize=DEFAULT_MEMOIZE_SIZE):
+    # Caches the hook's results by value, in a fresh LRU for every serialization
+    def decorator(representation):
+        representation.memoize = maxsize
+        return representation
+
+    return decorator
+
+
+def batch_representation(representation):
+    # The hook receives a list of distinct values and returns a dict mapping each one to its representation
+    representation.batch = True
+    return representation
+
+
+def memoize(func, maxsize):
+    cached_func = lru_cache(maxsize)(func)
+
+    def call(value):
+        try:
+            hash(value)
+        except TypeError:
+            return func(value)
+
+        return cached_func(value)
+
+    return call
+
+
+def split_paths(paths) -> dict:
+    # ['name', 'related__name'] => {'name': [], 'related': ['name']}
+    fields = {}
+
+    for path in paths:
+        field, _, related_path = path.partition('__')
+        related_paths = fields.setdefault(field, [])
+
+        if related_path:
+            related_paths.append(related_path)
+
+    return fields
+
+
+def format_selection(selection) -> str:
+    return ','.join(
+        field if related_selection is None else f'{field}({format_selection(related_selection)})'
+        for field, related_selection in selection
+    )
+
+
+def freeze(value):
+    if isinstance(value, dict):
+        return tuple(freeze(item) for item in value.values())
+
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+
+    return value
 
 
 class Serializer(metaclass=SerializerMeta):
+    # Set on the classes built by `get_sparse_class`: the serializer they narrow and their selection of it
+    sparse_base = None
+    sparse_selection = None
 
     def __init__(self, initial_data=None, related_to=None):
         self.data = self.get_iterable_initial_data(initial_data)
-        self.model_fields = self.get_model_fields()
+        self.related_serializers = {}
+        self.representers = None
+        self.active_profile = None
+        self.last_report = None
 
     def get_iterable_initial_data(self, initial_data) -> Iterable:
         if isinstance(initial_data, Iterable):
@@ -95,73 +584,739 @@ class Serializer(metaclass=SerializerMeta):
         return self.model.objects.all()
 
     def get_model_fields(self):
-        model_meta = self.model._meta
-        model_fields = list(model_meta.concrete_fields) + list(model_meta.private_fields)
+        return list(self.model_fields)
+
+    @classmethod
+    def get_sparse_class(cls, only=None, exclude=None):
+        """
+        Returns a serializer class restricted to the `only` fields minus the `exclude` ones. Nested fields
+        are narrowed with `related__name` paths. Classes are created once per resulting field selection.
+        """
+        return cls.get_selection_class(cls.get_selection(only, exclude or ()))
+
+    @classmethod
+    def get_selection(cls, only, exclude) -> tuple:
+        # The fields left by `only` and `exclude` in declared order, each with the selection of its nested fields
+        only_paths = split_paths(only) if only is not None else None
+        exclude_paths = split_paths(exclude)
+
+        for field in chain(only_paths or (), exclude_paths):
+            if field not in cls.fields:
+                raise Exception(f'{field} is not a field of {cls.__name__}')
+
+            related_paths = (only_paths or {}).get(field) or exclude_paths.get(field)
+            if related_paths and not cls.foo[field]['serializer']['class']:
+                raise Exception(f'{field} has no nested serializer to select fields from')
+
+        selection = []
+
+        for field in cls.fields:
+            if only_paths is not None and field not in only_paths:
+                continue
+
+            if field in exclude_paths and not exclude_paths[field]:
+                continue
+
+            related_selection = None
+            related_only = only_paths[field] if only_paths and only_paths[field] else None
+            related_exclude = exclude_paths.get(field)
+
+            if related_only is not None or related_exclude:
+                serializer_related = cls.foo[field]['serializer']['class']
+                related_selection = serializer_related.get_selection(related_only, related_exclude or ())
+
+                if related_selection == serializer_related.get_full_selection():
+                    related_selection = None
+
+            selection.append((field, related_selection))
+
+        if not selection:
+            raise Exception(f'No fields of {cls.__name__} are left to serialize')
+
+        return tuple(selection)
 
-        return model_fields
+    @classmethod
+    def get_full_selection(cls) -> tuple:
+        return tuple((field, None) for field in cls.fields)
+
+    @classmethod
+    def get_selection_class(cls, selection):
+        # Sparse classes are always built from the serializer they narrow, which owns their cache
+        if cls.sparse_base is not None:
+            return cls.sparse_base.get_selection_class(cls.get_base_selection(selection))
+
+        if selection == cls.get_full_selection():
+            return cls
+
+        with sparse_lock:
+            sparse_class = cls.sparse_classes.get(selection)
+
+            if sparse_class is not None:
+                cls.sparse_classes.move_to_end(selection)
+                return sparse_class
+
+            sparse_class = cls.sparse_classes[selection] = cls.build_sparse_class(selection)
+
+            # Selections come from requests, the least recently used classes are dropped
+            if len(cls.sparse_classes) > MAX_SPARSE_CLASSES:
+                _, evicted = cls.sparse_classes.popitem(last=False)
+
+                if evicted.cache_options:
+                    from serializer.cache import forget
+
+                    forget(evicted)
+
+        return sparse_class
+
+    @classmethod
+    def get_base_selection(cls, selection) -> tuple:
+        # `selection` of a sparse class as a selection of the serializer it narrows
+        base_selection = []
+
+        for field, related_selection in selection:
+            serializer_related = cls.foo[field]['serializer']['class']
+
+            if serializer_related and serializer_related.sparse_base is not None:
+                related_base = serializer_related.sparse_base
+                related_selection = serializer_related.get_base_selection(
+                    related_selection or serializer_related.get_full_selection()
+                )
+
+                if related_selection == related_base.get_full_selection():
+                    related_selection = None
+
+            base_selection.append((field, related_selection))
+
+        return tuple(base_selection)
+
+    @classmethod
+    def build_sparse_class(cls, selection):
+        attrs = {'__module__': cls.__module__, 'sparse_base': cls, 'sparse_selection': selection}
+
+        for field, related_selection in selection:
+            serializer_related = cls.foo[field]['serializer']['class']
+            if serializer_related:
+                attrs[field] = (
+                    serializer_related if related_selection is None
+                    else serializer_related.get_selection_class(related_selection)
+                )
+
+            if cls.foo[field]['representation']:
+                attrs[f'representation_{field}'] = cls.foo[field]['representation']
+
+        attrs['Meta'] = type('Meta', (cls.Meta,), {'fields': [field for field, _ in selection]})
+        attrs['__qualname__'] = f'{cls.__qualname__}[{format_selection(selection)}]'
+
+        return type(cls)(cls.__name__, (cls,), attrs)
+
+    def sparse(self, only=None, exclude=None):
+        return self.get_sparse_class(only, exclude)(self.data)
+
+    def serialize(self, mode, only=None, exclude=None, **kwargs):
+        if only is not None or exclude:
+            sparse = self.sparse(only, exclude)
+            return self.delegated(sparse, partial(sparse.serialize, mode, **kwargs))()
 
-    def serialize(self, mode):
         function_name = f'{mode}_serialization'
         if hasattr(self, function_name):    #########
-            return getattr(self, function_name)()
+            builder = self.profiled('serialize', partial(getattr(self, function_name), **kwargs))
+
+            if self.cache_options:
+                from serializer.cache import cached
+
+                return cached(self, (function_name, sorted(kwargs.items())), builder)
+
+            return builder()
 
         raise Exception('Invalid serialization mode')
 
+    def profile(self, callback=None):
+        """
+        Context manager profiling every serialization and creation made with this serializer inside it. The
+        report is kept in `last_report` and passed to `callback`; `Meta.instrument` profiles every call.
+        """
+        from serializer.instrumentation import profiling
+
+        return profiling(self, callback)
+
+    def profiled(self, phase, function):
+        if not self.instrument and self.active_profile is None:
+            return function
+
+        from serializer.instrumentation import profiled
+
+        return profiled(self, phase, function)
+
+    def delegated(self, serializer, function):
+        if not self.instrument and self.active_profile is None:
+            return function
+
+        from serializer.instrumentation import delegated
+
+        return delegated(self, serializer, function)
+
+    @classmethod
+    def cache_info(cls) -> dict:
+        from serializer.cache import cache_info
+
+        return cache_info(cls)
+
+    @classmethod
+    def clear_cache(cls):
+        from serializer.cache import clear
+
+        clear(cls)
+
     def normal_serialization(self) -> list:
-        all_obj_data = [self.to_dict(obj) for obj in self.data]
+        fields = self.fields
+        all_obj_data = [dict(zip(fields, values)) for values in self.iter_field_values(nested_mode='normal')]
         return all_obj_data
 
-    def split_serialization(self) -> dict:
-        all_obj_data = [self.get_field_values(obj) for obj in self.data]
+    def record_serialization(self) -> list:
+        record_class = self.record_class
+        return [record_class(*values) for values in self.iter_field_values(nested_mode='record')]
+
+    def split_serialization(self, dictionary=None) -> dict:
+        all_obj_data = list(self.iter_field_values())
+        split = {
+            MODEL: self.fields,
+            DATA: all_obj_data
+        }
+
+        if dictionary:
+            tables = self.dictionary_encode(all_obj_data, dictionary)
+            if tables:
+                split[DICTIONARY] = tables
+
+        return split
+
+    def dictionary_encode(self, all_values, dictionary) -> dict:
+        """
+        Replaces the values of the `dictionary` fields by codes into a per field table of distinct values. With
+        True every field is considered and only kept when it has at most half as many distinct values as rows.
+        """
+        if dictionary is not True and not set(dictionary) <= set(self.fields):
+            raise Exception(f'Invalid ´{DICTIONARY}´, Fields must be serializer fields')
+
+        tables = {}
+
+        for index, field in enumerate(self.fields):
+            if dictionary is not True and field not in dictionary:
+                continue
+
+            codes_by_key = {}
+            table = []
+            codes = []
+
+            for values in all_values:
+                value = values[index]
+                key = freeze(value)
+
+                code = codes_by_key.get(key)
+                if code is None:
+                    code = codes_by_key[key] = len(table)
+                    table.append(value)
+
+                codes.append(code)
+
+            if dictionary is True and len(table) * 2 > len(all_values):
+                continue
+
+            for values, code in zip(all_values, codes):
+                values[index] = code
+
+            tables[field] = table
+
+        return tables
+
+    def dictionary_decode(self, fields_model, data, tables) -> Iterable:
+        if not set(tables) <= set(fields_model):
+            raise Exception(f'Invalid ´{DICTIONARY}´, Keys must be the model fields')
+
+        columns = [(fields_model.index(field), table) for field, table in tables.items()]
+
+        for row, values in enumerate(data):
+            values = list(values)
+
+            for index, table in columns:
+                code = values[index]
+                if not isinstance(code, int) or not 0 <= code < len(table):
+                    raise Exception(f'Invalid Data, row {row} has no ´{fields_model[index]}´ code {code}')
+
+                values[index] = table[code]
+
+            yield values
+
+    def delta_serialization(self, since=None, known=None) -> dict:
+        if not self.watermark:
+            raise Exception('Delta serialization requires a ´watermark´ in Meta')
+
+        if not isinstance(self.data, QuerySet):
+            raise Exception('Delta serialization requires a QuerySet')
+
+        queryset = self.data
+        if since is not None:
+            queryset = queryset.filter(**{f'{self.watermark}__gt': since})
+
+        # Rows past the new watermark are left for the next poll, even if they land during this one
+        next_watermark = queryset.aggregate(watermark=Max(self.watermark))['watermark']
+
+        if next_watermark is None:
+            all_obj_data = []
+            next_watermark = since
+        else:
+            queryset = queryset.filter(**{f'{self.watermark}__lte': next_watermark}).order_by(self.watermark)
+            all_obj_data = list(type(self)(queryset).iter_field_values(DEFAULT_CHUNK_SIZE))
+
+        delta = {
+            MODEL: self.fields,
+            DATA: all_obj_data,
+            WATERMARK: next_watermark,
+        }
+
+        if known is not None:
+            delta[REMOVED] = self.get_removed(known)
+
+        return delta
+
+    def get_removed(self, known) -> list:
+        # The tombstones of a delta: known primary keys that `remove_objects` would now have to exclude
+        known = list(known)
+        existing = set()
+
+        for pks in chunked(known, KEY_LOOKUP_SIZE):
+            existing.update(self.data.filter(pk__in=pks).values_list('pk', flat=True))
+
+        return [pk for pk in known if pk not in existing]
+
+    def serialize_page(self, mode='split', after=None, limit=DEFAULT_PAGE_SIZE, order_by=None) -> tuple:
+        """
+        Returns a page of at most `limit` rows and the cursor of the next one, None on the last page. Pages are
+        sought by `order_by`, which should be indexed and is completed with the primary key to be unique.
+        """
+        if not isinstance(self.data, QuerySet):
+            raise Exception('Pagination requires a QuerySet')
+
+        if mode not in ('normal', 'record', 'split'):
+            raise Exception(f'Mode ´{mode}´ can not be paginated')
+
+        if not isinstance(limit, int) or isinstance(limit, bool) or limit <= 0:
+            raise Exception('Invalid limit, it must be a positive integer')
+
+        ordering = self.get_page_ordering(order_by)
+        queryset = self.data.order_by(*ordering)
+
+        if after is not None:
+            queryset = queryset.filter(self.get_seek_filter(ordering, self.decode_cursor(ordering, after)))
+
+        key_attnames = [self.get_ordering_field(name).attname for name in ordering]
+        # One row past the page tells whether there is a next one
+        keyed_rows = type(self)(queryset).get_keyed_rows(key_attnames, limit + 1)
+
+        next_cursor = None
+        if len(keyed_rows) > limit:
+            keyed_rows = keyed_rows[:limit]
+            next_cursor = self.encode_cursor(ordering, keyed_rows[-1][0])
+
+        rows = (values for _, values in keyed_rows)
+        all_obj_data = list(self.represent_rows(rows, nested_mode=mode))
+
+        if mode == 'normal':
+            return [dict(zip(self.fields, values)) for values in all_obj_data], next_cursor
+
+        if mode == 'record':
+            return [self.record_class(*values) for values in all_obj_data], next_cursor
+
         return {
             MODEL: self.fields,
             DATA: all_obj_data
+        }, next_cursor
+
+    def get_page_ordering(self, order_by) -> list:
+        if isinstance(order_by, str):
+            order_by = [order_by]
+
+        ordering = list(order_by or [])
+        pk_name = self.model._meta.pk.name
+
+        if not any(name.lstrip('-') in ('pk', pk_name) for name in ordering):
+            ordering.append('pk')
+
+        for name in ordering:
+            if self.get_ordering_field(name).null:
+                raise Exception(f'Can not paginate by ´{name}´, it is nullable')
+
+        return ordering
+
+    def get_ordering_field(self, name) -> Field:
+        name = name.lstrip('-')
+        if name == 'pk':
+            return self.model._meta.pk
+
+        return SerializerMeta._get_model_field(self.model, name)
+
+    @staticmethod
+    def get_seek_filter(ordering, keys) -> Q:
+        # (a, b) after (x, y) is a > x or (a == x and b > y), with lt for the descending fields
+        seek_filter = Q()
+        equal = {}
+
+        for name, key in zip(ordering, keys):
+            lookup = 'lt' if name.startswith('-') else 'gt'
+            name = name.lstrip('-')
+
+            seek_filter |= Q(**equal, **{f'{name}__{lookup}': key})
+            equal[name] = key
+
+        return seek_filter
+
+    def get_keyed_rows(self, key_attnames, limit) -> list:
+        # The keys of the next cursor are read by the same query as the rows
+        size = len(key_attnames)
+
+        if self.can_project():
+            rows = self.data.values_list(*key_attnames, *self.attnames)[:limit]
+            return [(row[:size], row[size:]) for row in rows]
+
+        return [
+            (tuple(getattr(instance, attname) for attname in key_attnames), self.row_getter(instance))
+            for instance in self.optimize_queryset(self.data)[:limit]
+        ]
+
+    @staticmethod
+    def encode_cursor(ordering, keys) -> str:
+        # DjangoJSONEncoder cuts times down to milliseconds, seeking needs them whole
+        keys = [key.isoformat() if hasattr(key, 'isoformat') else key for key in keys]
+        content = json.dumps([ordering, keys], cls=DjangoJSONEncoder, separators=(',', ':'))
+        return base64.urlsafe_b64encode(content.encode()).decode()
+
+    def decode_cursor(self, ordering, cursor) -> list:
+        try:
+            cursor_ordering, keys = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (TypeError, ValueError, AttributeError):
+            raise Exception('Invalid cursor')
+
+        if cursor_ordering != ordering or len(keys) != len(ordering):
+            raise Exception('Invalid cursor, it belongs to another ordering')
+
+        return [self.get_ordering_field(name).to_python(key) for name, key in zip(ordering, keys)]
+
+    def columnar_serialization(self) -> dict:
+        # Numeric columns go to compact array buffers, everything else to plain lists
+        columns = [array(typecode) if typecode else [] for typecode in self.column_types]
+        appends = [column.append for column in columns]
+
+        for values in self.iter_field_values(DEFAULT_CHUNK_SIZE):
+            for append, value in zip(appends, values):
+                append(value)
+
+        return {
+            MODEL: self.fields,
+            COLUMNS: dict(zip(self.fields, map(self.as_column, columns)))
         }
 
-    def to_dict(self, instance_model):
-        dict_model = {}
+    @staticmethod
+    def as_column(column):
+        if numpy is not None and isinstance(column, array):
+            return numpy.frombuffer(column, dtype=NUMPY_DTYPES[column.typecode])
 
-        for field in self.fields:
-            value_str = self.foo[field]['model_field'].value_from_object(instance_model)
+        return column
 
-            custom_representation = self.foo[field]['representation']
-            if custom_representation:
-                value_str = custom_representation(self, value_str)
+    def iter_serialize(self, mode, chunk_size=DEFAULT_CHUNK_SIZE, only=None, exclude=None):
+        if only is not None or exclude:
+            sparse = self.sparse(only, exclude)
 
-            dict_model[field] = value_str
+            if self.instrument or self.active_profile is not None:
+                from serializer.instrumentation import iter_delegated
 
-        return dict_model
+                return iter_delegated(self, sparse, partial(sparse.iter_serialize, mode, chunk_size))
 
-    def get_field_values(self, instance_model):
-        field_values = []
+            return sparse.iter_serialize(mode, chunk_size)
 
-        for field in self.fields:
-            value_str = self.foo[field]['model_field'].value_from_object(instance_model)
+        function_name = f'iter_{mode}_serialization'
+        if hasattr(self, function_name):
+            rows = getattr(self, function_name)(chunk_size)
+
+            if self.instrument or self.active_profile is not None:
+                from serializer.instrumentation import iter_profiled
+
+                return iter_profiled(self, 'serialize', rows)
+
+            return rows
+
+        raise Exception('Invalid serialization mode')
+
+    def iter_normal_serialization(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        fields = self.fields
+
+        for values in self.iter_field_values(chunk_size, nested_mode='normal'):
+            yield dict(zip(fields, values))
+
+    def iter_record_serialization(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        record_class = self.record_class
+
+        for values in self.iter_field_values(chunk_size, nested_mode='record'):
+            yield record_class(*values)
+
+    def iter_split_serialization(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        yield self.fields
+        yield from self.iter_field_values(chunk_size)
+
+    async def aserialize(self, mode, chunk_size=DEFAULT_CHUNK_SIZE, only=None, exclude=None, **kwargs):
+        """
+        `serialize` for async code. Chunks are fetched on the database thread one at a time, so other requests
+        interleave between them; it holds a single connection but is not faster than a thread per request.
+        """
+        if self.cache_options or kwargs or not hasattr(self, f'iter_{mode}_serialization'):
+            serialize = partial(self.serialize, mode, only, exclude, **kwargs)
+            return await sync_to_async(serialize, thread_sensitive=True)()
+
+        all_obj_data = [row async for row in self.aiter_serialize(mode, chunk_size, only, exclude)]
+
+        if mode == 'split':
+            return {
+                MODEL: all_obj_data[0],
+                DATA: all_obj_data[1:]
+            }
+
+        return all_obj_data
+
+    async def aiter_serialize(self, mode, chunk_size=DEFAULT_CHUNK_SIZE, only=None, exclude=None):
+        rows = self.iter_serialize(mode, chunk_size, only, exclude)
+
+        # Each chunk is a separate hop to the database thread, so other requests interleave between chunks
+        next_chunk = sync_to_async(lambda: list(islice(rows, chunk_size)), thread_sensitive=True)
+
+        while True:
+            chunk = await next_chunk()
+            if not chunk:
+                return
+
+            for row in chunk:
+                yield row
+
+    def dump(self, fp, mode, format='json', chunk_size=DEFAULT_CHUNK_SIZE):
+        for piece in self.encode(mode, format, chunk_size):
+            fp.write(piece)
+
+    def streaming_response(self, mode, format='json', chunk_size=DEFAULT_CHUNK_SIZE, **kwargs):
+        from django.http import StreamingHttpResponse
+        from serializer.encoders import get_encoder
+
+        kwargs.setdefault('content_type', get_encoder(format)['content_type'])
+        return StreamingHttpResponse(self.encode(mode, format, chunk_size), **kwargs)
+
+    def encode(self, mode, format='json', chunk_size=DEFAULT_CHUNK_SIZE) -> Iterable:
+        from serializer.encoders import encode, encode_all
+
+        if self.cache_options:
+            from serializer.cache import cached
+
+            content = cached(self, ('encode', mode, format), lambda: encode_all(self, mode, format, chunk_size))
+            return [content] if content is not None else []
+
+        return encode(self, mode, format, chunk_size)
+
+    def load(self, fp, mode='split', format='json', **kwargs):
+        from serializer.encoders import decode
+
+        return self.create(decode(fp, mode, format), mode, **kwargs)
+
+    def parallel_serialize(self, mode, workers=None, ordered=True):
+        from serializer.parallel import parallel_serialize
+
+        return parallel_serialize(self, mode, workers, ordered)
+
+    def iter_parallel_serialize(self, mode, workers=None, ordered=True):
+        from serializer.parallel import iter_parallel_serialize
+
+        return iter_parallel_serialize(self, mode, workers, ordered)
+
+    def iter_field_values(self, chunk_size=None, nested_mode='split'):
+        return self.represent_rows(self.get_rows(chunk_size), chunk_size, nested_mode)
+
+    def represent_rows(self, rows, chunk_size=None, nested_mode='split'):
+        if not self.representations and not self.nested and not self.batch_representations:
+            return map(list, rows)
+
+        representers = self.get_representers()
+        self.prepare_related()
+
+        return self.iter_represented(rows, chunk_size, nested_mode, representers)
+
+    def prepare_related(self):
+        # Once per serialization, so memoized hooks of nested serializers keep their cache across rows
+        for _, field in self.nested:
+            related = self.get_related_serializer(field)
+            related.representers = related.get_representers()
+            related.prepare_related()
+
+    def get_representers(self) -> list:
+        representers = []
+
+        for index, representation in self.representations:
+            representer = partial(representation, self)
+
+            maxsize = getattr(representation, 'memoize', None) or self.memoize_size
+            if maxsize:
+                representer = memoize(representer, maxsize)
+
+            if self.active_profile is not None:
+                representer = self.active_profile.timed_hook(self.fields[index], representer)
+
+            representers.append((index, representer))
+
+        return representers
+
+    def iter_represented(self, rows, chunk_size=None, nested_mode='split', representers=None):
+        # Without a chunk size the whole column is handed to the batch hooks at once
+        for chunk in chunked(rows, chunk_size) if chunk_size else [rows]:
+            yield from self.represent_chunk(chunk, nested_mode, representers)
 
-            custom_representation = self.foo[field]['representation']
-            if custom_representation:
-                value_str = custom_representation(self, value_str)
+    def represent_chunk(self, rows, nested_mode='split', representers=None) -> list:
+        all_values = [list(row) for row in rows]
 
-            field_values.append(value_str)
+        for index, field in self.nested:
+            self.represent_related_column(all_values, index, field, nested_mode)
 
-        return field_values
+        for index, representer in self.get_representers() if representers is None else representers:
+            for values in all_values:
+                values[index] = representer(values[index])
 
-    def create(self, obj_data, mode):
+        self.apply_batch_representations(all_values)
+
+        return all_values
+
+    def represent_related_column(self, all_values, index, field, nested_mode='split'):
+        # The related instances of a chunk are represented together, so their batch hooks run once per chunk
+        related = self.get_related_serializer(field)
+        related_values = [values for values in all_values if values[index] is not None]
+
+        related_rows = [related.row_getter(values[index]) for values in related_values]
+        represented = related.represent_chunk(related_rows, nested_mode, related.representers)
+
+        for values, related_row in zip(related_values, represented):
+            values[index] = related.shape(related_row, nested_mode)
+
+    def shape(self, values, mode='split'):
+        if mode == 'normal':
+            return dict(zip(self.fields, values))
+
+        if mode == 'record':
+            return self.record_class(*values)
+
+        return values
+
+    def apply_batch_representations(self, all_values):
+        if not all_values:
+            return
+
+        for index, representation in self.batch_representations:
+            if self.active_profile is not None:
+                representation = self.active_profile.timed_hook(self.fields[index], representation)
+
+            distinct_values = list(dict.fromkeys(values[index] for values in all_values))
+            representations = representation(self, distinct_values)
+
+            for values in all_values:
+                values[index] = representations[values[index]]
+
+    def get_rows(self, chunk_size=None) -> Iterable:
+        if self.can_project():
+            rows = self.iterate(self.data.values_list(*self.attnames), chunk_size)
+        else:
+            rows = map(self.row_getter, self.iterate(self.optimize_queryset(self.data), chunk_size))
+
+        if self.active_profile is not None:
+            return self.active_profile.iter_timed('fetch', rows, count_rows=True)
+
+        return rows
+
+    def can_project(self) -> bool:
+        # values_list skips model instantiation, unless the instances are already loaded
+        return (
+            self.attnames is not None
+            and isinstance(self.data, QuerySet)
+            and self.data._result_cache is None
+        )
+
+    def optimize_queryset(self, data):
+        if not isinstance(data, QuerySet) or data._result_cache is not None:
+            return data
+
+        # Joins every nested serializer's table in the same query instead of one query per row
+        if self.select_related:
+            data = data.select_related(*self.select_related)
+
+        # Loads only the declared columns, unless the caller already chose which ones to defer
+        if self.only_paths is not None and data.query.deferred_loading == (frozenset(), True):
+            data = data.only(*self.only_paths)
+
+        return data
+
+    @staticmethod
+    def iterate(data, chunk_size=None) -> Iterable:
+        # iterator() bypasses the result cache and uses server-side cursors where the backend has them
+        if chunk_size and isinstance(data, QuerySet) and data._result_cache is None:
+            return data.iterator(chunk_size=chunk_size)
+
+        return data
+
+    def represent_instance(self, instance_model, mode='split'):
+        return self.shape(self.get_field_values(instance_model, mode), mode)
+
+    def get_related_serializer(self, field):
+        if field not in self.related_serializers:
+            related = self.foo[field]['serializer']['class']([])
+
+            # Nested representations are timed as a whole, under the field holding them
+            if self.active_profile is not None:
+                related.represent_chunk = self.active_profile.timed_hook(field, related.represent_chunk)
+
+            self.related_serializers[field] = related
+
+        return self.related_serializers[field]
+
+    def to_dict(self, instance_model):
+        return dict(zip(self.fields, self.get_field_values(instance_model, 'normal')))
+
+    def get_field_values(self, instance_model, nested_mode='split'):
+        self.prepare_related()
+        return self.represent_chunk([self.row_getter(instance_model)], nested_mode)[0]
+
+    def create(self, obj_data, mode, **kwargs):
         function_name = f'{mode}_creation'
         if hasattr(self, function_name):
-            return getattr(self, function_name)(obj_data)
+            return self.profiled('create', partial(getattr(self, function_name), obj_data, **kwargs))()
 
         raise Exception('Invalid creation mode')
 
-    def normal_creation(self, obj_data):
+    async def acreate(self, obj_data, mode, **kwargs):
+        return await sync_to_async(self.create, thread_sensitive=True)(obj_data, mode, **kwargs)
+
+    def normal_creation(self, obj_data, bulk=False, batch_size=DEFAULT_BATCH_SIZE, validate=True):
         data_type = type(obj_data)
 
         if data_type == dict:
-            self.create_single_instance(obj_data)
+            if validate:
+                obj_data = self.validate_payloads([obj_data])[0]
+
+            return self.create_single_instance(obj_data)
         elif data_type == list:
+            if validate:
+                obj_data = self.validate_payloads(obj_data)
+
+            if bulk:
+                rows_data = (self.get_payload_data(obj) for obj in obj_data)
+                return self.bulk_create_instances(rows_data, batch_size)
+
             self.create_multiple_instances(obj_data)
 
     def create_single_instance(self, obj_data: dict):
+        data_to_create = self.get_data_to_create(obj_data)
+        return self.create_instance(self.model, data_to_create)
+
+    def get_data_to_create(self, obj_data: dict) -> dict:
         obj_fields = list(obj_data.keys())
 
         if obj_fields != self.fields:
@@ -176,7 +1331,7 @@ class Serializer(metaclass=SerializerMeta):
             else:
                 data_to_create[field] = obj_data[field]
 
-        return self.create_instance(self.model, data_to_create)
+        return data_to_create
 
     @staticmethod
     def create_instance(model, obj_data):
@@ -186,15 +1341,346 @@ class Serializer(metaclass=SerializerMeta):
         for obj in obj_data:
             self.create_single_instance(obj)
 
-    def split_creation(self, obj_data: dict):
+    def bulk_create_instances(self, rows_data, batch_size=DEFAULT_BATCH_SIZE, return_pks=True, native=False):
+        manager = self.model.objects
+        created_pks = []
+        created_count = 0
+        related_cache = {}
+
+        insert = manager.bulk_create
+        if native:
+            from serializer.loaders import get_loader
+
+            # COPY or a single prepared INSERT, neither gives the primary keys back
+            connection = connections[manager.db]
+            insert = partial(get_loader(connection), self.model, connection)
+            return_pks = False
+
+        with transaction.atomic(using=manager.db):
+            # Django sizes the INSERT statements within a chunk to the backend's limits
+            for batch in chunked(rows_data, batch_size):
+                if self.nested:
+                    self.resolve_related(batch, related_cache, batch_size)
+
+                instances = [self.model(**data) for data in batch]
+                created = insert(instances)
+                created_count += len(created)
+
+                if return_pks:
+                    created_pks.extend(instance.pk for instance in created)
+
+        for model in self.related_models:
+            post_bulk_create.send(sender=model)
+
+        if not return_pks:
+            return created_count
+
+        if not connections[manager.db].features.can_return_rows_from_bulk_insert:
+            return None
+
+        return created_pks
+
+    def get_payload_data(self, payload) -> dict:
+        if isinstance(payload, dict):
+            if list(payload.keys()) != self.fields:
+                raise Exception("Invalid Data, Keys must be the model fields")
+
+            return dict(payload)
+
+        if len(payload) != len(self.fields):
+            raise Exception("Invalid Data, Values must match the model fields")
+
+        return dict(zip(self.fields, payload))
+
+    def resolve_related(self, batch, related_cache, batch_size=DEFAULT_BATCH_SIZE):
+        # Replaces nested payloads by instances, inserting each distinct payload only once per creation
+        for _, field in self.nested:
+            related = self.get_related_serializer(field)
+            instances_by_key, nested_cache = related_cache.setdefault(field, ({}, {}))
+
+            keys = []
+            new_payloads = {}
+
+            for data in batch:
+                payload = data[field]
+                key = None if payload is None else freeze(payload)
+                keys.append(key)
+
+                if key is not None and key not in instances_by_key and key not in new_payloads:
+                    new_payloads[key] = related.get_payload_data(payload)
+
+            if new_payloads:
+                create_related_batch = related.create_related_batch
+                if self.active_profile is not None:
+                    phase = f'create_related.{field}'
+                    create_related_batch = self.active_profile.timed_phase(phase, create_related_batch)
+
+                create_related_batch(new_payloads, instances_by_key, nested_cache, batch_size)
+
+            for data, key in zip(batch, keys):
+                data[field] = None if key is None else instances_by_key[key]
+
+    def create_related_batch(self, payloads_by_key, instances_by_key, related_cache, batch_size=DEFAULT_BATCH_SIZE):
+        rows_data = list(payloads_by_key.values())
+
+        if self.nested:
+            self.resolve_related(rows_data, related_cache, batch_size)
+
+        instances = [self.model(**data) for data in rows_data]
+        self.bulk_create_with_pks(instances, batch_size)
+
+        instances_by_key.update(zip(payloads_by_key, instances))
+
+    def bulk_create_with_pks(self, instances, batch_size=DEFAULT_BATCH_SIZE):
+        manager = self.model.objects
+
+        if connections[manager.db].features.can_return_rows_from_bulk_insert:
+            return manager.bulk_create(instances)
+
+        # Without RETURNING, only instances that already have their primary key can share an INSERT. The others
+        # are inserted one by one, once per distinct payload since they are deduplicated by resolve_related
+        with_pks = [instance for instance in instances if instance.pk is not None]
+        if with_pks:
+            manager.bulk_create(with_pks)
+
+        for instance in instances:
+            if instance.pk is None:
+                instance.save(force_insert=True, using=manager.db)
+
+        return instances
+
+    @staticmethod
+    def normalize_values(model_fields, values) -> tuple:
+        return tuple(model_field.to_python(value) for model_field, value in zip(model_fields, values))
+
+    def split_creation(self, obj_data: dict, bulk=False, batch_size=DEFAULT_BATCH_SIZE, validate=True, native=False):
         fields_model = obj_data.pop(MODEL, None)
         data = obj_data.pop(DATA, None)
+        tables = obj_data.pop(DICTIONARY, None)
 
         self.assert_fields_model_valid(fields_model)
         self.assert_data_is_valid(data)
 
+        if tables:
+            data = self.dictionary_decode(fields_model, data, tables)
+
+        if validate:
+            data = self.validate_data(data)
+
+        if bulk or native:
+            rows_data = (dict(zip(fields_model, specific_obj)) for specific_obj in data)
+            return self.bulk_create_instances(rows_data, batch_size, native=native)
+
         self.form_data_and_create(fields_model, data)
 
+    def create_from_file(self, path, mode='split', format='ndjson', batch_size=DEFAULT_BATCH_SIZE,
+                         validate=True, native=False) -> int:
+        """
+        Bulk creates the rows of a file written by `dump`, which is memory-mapped and parsed one row at a time.
+        Returns the number of created rows.
+        """
+        from serializer.encoders import read_file
+
+        with read_file(path, format) as values:
+            creation = partial(self.stream_creation, values, mode, batch_size, validate, native)
+            return self.profiled('create', creation)()
+
+    def stream_creation(self, values, mode='split', batch_size=DEFAULT_BATCH_SIZE, validate=True,
+                        native=False) -> int:
+        values = iter(values)
+
+        if mode == 'split':
+            self.assert_fields_model_valid(next(values, None))
+            rows = values
+        elif mode == 'normal':
+            rows = (list(self.get_payload_data(payload).values()) for payload in values)
+        else:
+            raise Exception(f'Mode ´{mode}´ can not be streamed')
+
+        # Rows are validated batch by batch inside the transaction, an error rolls back the inserted batches
+        if validate:
+            rows = self.iter_validated_data(rows)
+
+        rows_data = (dict(zip(self.fields, row)) for row in rows)
+        return self.bulk_create_instances(rows_data, batch_size, return_pks=False, native=native)
+
+    def sync_creation(self, obj_data: dict, delete_missing=False, batch_size=DEFAULT_BATCH_SIZE,
+                      validate=True) -> dict:
+        fields_model = obj_data.pop(MODEL, None)
+        data = obj_data.pop(DATA, None)
+        tables = obj_data.pop(DICTIONARY, None)
+
+        self.assert_fields_model_valid(fields_model)
+        self.assert_data_is_valid(data)
+        self.assert_sync_is_valid()
+
+        if tables:
+            data = self.dictionary_decode(fields_model, data, tables)
+
+        if validate:
+            data = self.validate_data(data)
+
+        model_fields = [self.foo[field]['model_field'] for field in self.fields]
+        key_indexes = [self.fields.index(field) for field in self.key_fields]
+        # The primary key is matched through the key fields, it is never compared nor updated
+        compared_indexes = [index for index, model_field in enumerate(model_fields) if not model_field.primary_key]
+        update_fields = [
+            self.fields[index] for index in compared_indexes if self.fields[index] not in self.key_fields
+        ]
+
+        manager = self.model.objects
+        summary = {'created': 0, 'updated': 0, 'unchanged': 0, 'deleted': 0}
+        seen_keys = set()
+
+        with transaction.atomic(using=manager.db):
+            for batch in chunked(data, batch_size):
+                rows_by_key = {}
+                for specific_obj in batch:
+                    values = self.normalize_values(model_fields, specific_obj)
+                    rows_by_key[tuple(values[index] for index in key_indexes)] = values
+
+                existing = self.get_existing_rows(rows_by_key.keys(), model_fields, key_indexes)
+
+                to_create = []
+                to_update = []
+                for key, values in rows_by_key.items():
+                    if key not in existing:
+                        to_create.append(self.model(**dict(zip(self.fields, values))))
+                    elif any(existing[key][1][index] != values[index] for index in compared_indexes):
+                        fields_values = {self.fields[index]: values[index] for index in compared_indexes}
+                        to_update.append(self.model(pk=existing[key][0], **fields_values))
+                    else:
+                        summary['unchanged'] += 1
+
+                manager.bulk_create(to_create)
+                if to_update and update_fields:
+                    manager.bulk_update(to_update, update_fields)
+
+                summary['created'] += len(to_create)
+                summary['updated'] += len(to_update)
+                seen_keys.update(rows_by_key)
+
+            if delete_missing:
+                summary['deleted'] = self.delete_missing_rows(seen_keys, model_fields, key_indexes, batch_size)
+
+        post_bulk_create.send(sender=self.model)
+
+        return summary
+
+    def assert_sync_is_valid(self):
+        if not self.key_fields:
+            raise Exception('Sync creation requires ´key_fields´ in Meta')
+
+        if any(field not in self.fields for field in self.key_fields):
+            raise Exception('´key_fields´ must be serializer fields')
+
+        if self.nested:
+            raise Exception('Sync creation does not support nested serializers')
+
+    def get_existing_rows(self, keys, model_fields, key_indexes) -> dict:
+        key_attnames = [model_field.attname for model_field in (model_fields[index] for index in key_indexes)]
+        attnames = [model_field.attname for model_field in model_fields]
+        existing = {}
+
+        for keys_chunk in chunked(keys, KEY_LOOKUP_SIZE):
+            if len(key_attnames) == 1:
+                condition = Q(**{f'{key_attnames[0]}__in': [key[0] for key in keys_chunk]})
+            else:
+                condition = Q()
+                for key in keys_chunk:
+                    condition |= Q(**dict(zip(key_attnames, key)))
+
+            for pk, *values in self.model.objects.filter(condition).values_list('pk', *attnames):
+                values = self.normalize_values(model_fields, values)
+                existing[tuple(values[index] for index in key_indexes)] = (pk, values)
+
+        return existing
+
+    def delete_missing_rows(self, seen_keys, model_fields, key_indexes, batch_size=DEFAULT_BATCH_SIZE) -> int:
+        key_fields = [model_fields[index] for index in key_indexes]
+        key_attnames = [model_field.attname for model_field in key_fields]
+
+        missing_pks = [
+            pk
+            for pk, *key in self.model.objects.values_list('pk', *key_attnames).iterator()
+            if self.normalize_values(key_fields, key) not in seen_keys
+        ]
+
+        deleted = 0
+        for pks in chunked(missing_pks, batch_size):
+            deleted += self.model.objects.filter(pk__in=pks).delete()[1].get(self.model._meta.label, 0)
+
+        return deleted
+
+    def columnar_creation(self, obj_data: dict, batch_size=DEFAULT_BATCH_SIZE, validate=True):
+        fields_model = obj_data.pop(MODEL, None)
+        columns = obj_data.pop(COLUMNS, None)
+
+        self.assert_fields_model_valid(fields_model)
+        self.assert_columns_are_valid(columns)
+
+        rows = zip(*[self.as_values(columns[field]) for field in fields_model])
+        if validate:
+            rows = self.validate_data(rows)
+        rows_data = (dict(zip(fields_model, row)) for row in rows)
+
+        return self.bulk_create_instances(rows_data, batch_size)
+
+    @staticmethod
+    def as_values(column):
+        if numpy is not None and isinstance(column, numpy.ndarray):
+            return column.tolist()
+
+        return column
+
+    def assert_columns_are_valid(self, columns):
+        if columns is None:
+            raise Exception(f'´{COLUMNS}´ field must be informed')
+
+        if list(columns.keys()) != self.fields:
+            raise Exception(f"Invalid ´{COLUMNS}´, Keys must be the model fields")
+
+    @classmethod
+    def validate_values(cls, values) -> tuple:
+        if len(values) != len(cls.fields):
+            return values, [(None, 'Values must match the model fields')]
+
+        coerced_values = []
+        errors = []
+
+        for field, validator, value in zip(cls.fields, cls.validators, values):
+            try:
+                coerced_values.append(validator(value))
+            except (ValidationError, ValueError, TypeError) as error:
+                errors.append((field, get_error_message(error)))
+                coerced_values.append(value)
+
+        return coerced_values, errors
+
+    def validate_data(self, data) -> list:
+        # Checks every row before anything is written, reporting all the errors at once
+        return list(self.iter_validated_data(data))
+
+    def iter_validated_data(self, data) -> Iterable:
+        # Stops yielding rows at the first error but keeps checking, so all the errors are reported at the end
+        errors = []
+
+        for row, values in enumerate(data):
+            coerced_values, row_errors = self.validate_values(values)
+
+            for field, message in row_errors:
+                errors.append({'row': row, 'field': field, 'message': message})
+
+            if not errors:
+                yield coerced_values
+
+        if errors:
+            raise InvalidData(errors)
+
+    def validate_payloads(self, payloads) -> list:
+        all_values = self.validate_data([list(self.get_payload_data(payload).values()) for payload in payloads])
+        return [dict(zip(self.fields, values)) for values in all_values]
+
     def assert_fields_model_valid(self, fields_model):
         if fields_model is None:
             raise Exception(f'´{MODEL}´ field must be informed')
@@ -5,6 +5,47 @@ class BasicModel(models.Model):
     name = models.CharField(max_length=100)
 
 
+class ModelNumeric(models.Model):
+    name = models.CharField(max_length=100)
+    count = models.IntegerField()
+    ratio = models.FloatField()
+    active = models.BooleanField()
+    score = models.IntegerField(null=True)
+
+
+class ModelStatus(models.Model):
+    STATUSES = [
+        ('open', 'Open'),
+        ('closed', 'Closed'),
+    ]
+
+    name = models.CharField(max_length=10)
+    status = models.CharField(max_length=10, choices=STATUSES)
+    amount = models.IntegerField(null=True)
+
+
+class ModelEvent(models.Model):
+    name = models.CharField(max_length=100)
+    created = models.DateTimeField()
+
+
+class WideModel(models.Model):
+    name = models.CharField(max_length=100)
+    code = models.CharField(max_length=20)
+    description = models.CharField(max_length=255)
+    category = models.CharField(max_length=50)
+    quantity = models.IntegerField()
+    stock = models.IntegerField()
+    position = models.IntegerField()
+    year = models.IntegerField()
+    price = models.FloatField()
+    cost = models.FloatField()
+    weight = models.FloatField()
+    rating = models.FloatField()
+    active = models.BooleanField()
+    featured = models.BooleanField()
+
+
 # Relations
 
 
@@ -0,0 +1,68 @@
+from asgiref.sync import async_to_sync
+from django.test import TestCase
+
+from serializer.tests.models import BasicModel, ModelSimpleParent
+from serializer.tests.test_cache import CachedParentSerializer
+from serializer.tests.test_model_serializer import BasicSerializer, DeltaBasicSerializer, ParentWithIdSerializer
+
+
+class TestAsyncSerializer(TestCase):
+
+    def setUp(self):
+        BasicModel.objects.create(name='Basic')
+        BasicModel.objects.create(name='Basic2')
+        BasicModel.objects.create(name='Basic3')
+
+    def test_aserialize(self):
+        for mode in ['normal', 'split', 'columnar']:
+            expected = BasicSerializer().serialize(mode)
+
+            result = async_to_sync(BasicSerializer().aserialize)(mode, chunk_size=2)
+
+            self.assertEqual(expected, result)
+
+    def test_aserialize_accepts_serialize_arguments(self):
+        ModelSimpleParent.objects.create(name='Parent')
+        ModelSimpleParent.objects.create(name='Parent')
+
+        result = async_to_sync(ParentWithIdSerializer().aserialize)('split', only=['id'])
+        self.assertEqual(ParentWithIdSerializer().serialize('split', only=['id']), result)
+
+        result = async_to_sync(ParentWithIdSerializer().aserialize)('split', exclude=['id'], dictionary=['name'])
+        self.assertEqual(ParentWithIdSerializer().serialize('split', exclude=['id'], dictionary=['name']), result)
+
+        since = BasicModel.objects.get(name='Basic').pk
+        result = async_to_sync(DeltaBasicSerializer().aserialize)('delta', since=since)
+        self.assertEqual(DeltaBasicSerializer().serialize('delta', since=since), result)
+
+    def test_aserialize_uses_the_cache(self):
+        CachedParentSerializer.clear_cache()
+        ModelSimpleParent.objects.create(name='Parent')
+
+        expected = CachedParentSerializer().serialize('split')
+        result = async_to_sync(CachedParentSerializer().aserialize)('split')
+
+        self.assertEqual(expected, result)
+        self.assertEqual(CachedParentSerializer.cache_info()['hits'], 1)
+
+    def test_aiter_serialize(self):
+        async def collect():
+            return [row async for row in BasicSerializer().aiter_serialize('split', chunk_size=2)]
+
+        result = async_to_sync(collect)()
+
+        self.assertEqual([['name'], ['Basic'], ['Basic2'], ['Basic3']], result)
+
+    def test_acreate(self):
+        obj_data = {
+            'model': ['name'],
+            'data': [['Async'], ['Async2']]
+        }
+
+        async_to_sync(BasicSerializer().acreate)(obj_data, 'split', bulk=True)
+
+        self.assertEqual(BasicModel.objects.filter(name__startswith='Async').count(), 2)
+
+    def test_invalid_aserialize_mode(self):
+        with self.assertRaises(Exception):
+            async_to_sync(BasicSerializer().aserialize)('mode invalid')
@@ -0,0 +1,30 @@
+from django.test import TestCase
+
+from benchmarks.runner import compare, run_benchmarks
+
+
+class TestBenchmarks(TestCase):
+
+    def test_run_benchmarks(self):
+        report = run_benchmarks(sizes=[3], repeat=1)
+
+        names = [result['name'] for result in report['results']]
+
+        self.assertIn('wide.split_serialization', names)
+        self.assertIn('child.normal_creation.bulk', names)
+
+        for result in report['results']:
+            self.assertEqual(result['size'], 3)
+
+            if not result['name'].endswith('concurrent_threads'):
+                self.assertGreater(result['queries'], 0)
+
+    def test_compare_detects_regressions(self):
+        previous = {'results': [{'name': 'basic.split_serialization', 'size': 10, 'rows_per_second': 100}]}
+        current = {'results': [{'name': 'basic.split_serialization', 'size': 10, 'rows_per_second': 50}]}
+
+        regressions = compare(previous, current, threshold=0.1)
+
+        self.assertEqual(len(regressions), 1)
+        self.assertEqual(regressions[0]['ratio'], 0.5)
+        self.assertEqual(compare(previous, previous), [])
@@ -0,0 +1,179 @@
+import io
+
+from django.core.cache import caches
+from django.test import TestCase
+
+from serializer import encoders, serializers
+from serializer.cache import get_generation_key
+from serializer.tests.models import ModelChild, ModelSimpleParent, ModelStatus
+
+
+class CachedParentSerializer(serializers.Serializer):
+    class Meta:
+        model = ModelSimpleParent
+        fields = ['name']
+        cache = True
+        cache_max_entries = 2
+
+
+class CachedChildSerializer(serializers.Serializer):
+    related = CachedParentSerializer
+
+    class Meta:
+        model = ModelChild
+        fields = ['name', 'related']
+        cache = True
+
+
+class TestSerializerCache(TestCase):
+
+    def setUp(self):
+        CachedParentSerializer.clear_cache()
+        CachedChildSerializer.clear_cache()
+
+        self.parent = ModelSimpleParent.objects.create(name='Parent')
+        ModelChild.objects.create(name='Child', related=self.parent)
+
+    def test_repeated_serialization_hits_cache(self):
+        expected = CachedParentSerializer().serialize('split')
+
+        with self.assertNumQueries(0):
+            result = CachedParentSerializer().serialize('split')
+
+        self.assertEqual(expected, result)
+        self.assertEqual(CachedParentSerializer.cache_info(), {'hits': 1, 'misses': 1, 'entries': 1})
+
+    def test_different_querysets_are_cached_apart(self):
+        CachedParentSerializer().serialize('normal')
+
+        result = CachedParentSerializer(ModelSimpleParent.objects.filter(name='Other')).serialize('normal')
+
+        self.assertEqual([], result)
+        self.assertEqual(CachedParentSerializer.cache_info()['misses'], 2)
+
+    def test_save_and_delete_invalidate(self):
+        CachedParentSerializer().serialize('normal')
+
+        ModelSimpleParent.objects.create(name='Parent2')
+        self.assertEqual(
+            [{'name': 'Parent'}, {'name': 'Parent2'}],
+            CachedParentSerializer().serialize('normal')
+        )
+
+        ModelSimpleParent.objects.filter(name='Parent2').delete()
+        self.assertEqual([{'name': 'Parent'}], CachedParentSerializer().serialize('normal'))
+
+    def test_related_model_changes_invalidate(self):
+        CachedChildSerializer().serialize('normal')
+
+        self.parent.name = 'Renamed'
+        self.parent.save()
+
+        self.assertEqual(
+            [{'name': 'Child', 'related': {'name': 'Renamed'}}],
+            CachedChildSerializer().serialize('normal')
+        )
+
+    def test_bulk_creation_invalidates(self):
+        CachedParentSerializer().serialize('split')
+
+        CachedParentSerializer().create({'model': ['name'], 'data': [['Bulk']]}, 'split', bulk=True)
+
+        self.assertEqual(
+            [['Parent'], ['Bulk']],
+            CachedParentSerializer().serialize('split')['data']
+        )
+
+    def test_entries_are_bounded(self):
+        for name in ['a', 'b', 'c']:
+            CachedParentSerializer(ModelSimpleParent.objects.filter(name=name)).serialize('normal')
+
+        self.assertEqual(CachedParentSerializer.cache_info()['entries'], 2)
+
+    def test_cached_payloads_are_not_shared(self):
+        result = CachedParentSerializer().serialize('normal')
+        result[0]['name'] = 'Mutated'
+        result.append({'name': 'Extra'})
+
+        self.assertEqual([{'name': 'Parent'}], CachedParentSerializer().serialize('normal'))
+        self.assertEqual([{'name': 'Parent'}], CachedParentSerializer().serialize('normal'))
+
+    def test_encoded_output_is_cached(self):
+        expected = io.StringIO()
+        CachedParentSerializer().dump(expected, 'split')
+
+        result = io.StringIO()
+        with self.assertNumQueries(0):
+            CachedParentSerializer().dump(result, 'split')
+
+        self.assertEqual('{"model": ["name"], "data": [["Parent"]]}', result.getvalue())
+        self.assertEqual(expected.getvalue(), result.getvalue())
+
+    def test_sparse_records_are_cached(self):
+        expected = CachedChildSerializer().serialize('record', only=['name'])
+
+        with self.assertNumQueries(0):
+            result = CachedChildSerializer().serialize('record', only=['name'])
+
+        self.assertEqual(expected, result)
+        self.assertEqual(result[0].as_dict(), {'name': 'Child'})
+
+    def test_encoding_an_empty_table(self):
+        ModelChild.objects.all().delete()
+        ModelSimpleParent.objects.all().delete()
+
+        formats = [('ndjson', io.StringIO, '')] + ([('msgpack', io.BytesIO, b'')] if encoders.msgpack else [])
+
+        for format, buffer_class, empty in formats:
+            for _ in range(2):
+                fp = buffer_class()
+                CachedParentSerializer().dump(fp, 'normal', format=format)
+
+                self.assertEqual(empty, fp.getvalue())
+
+
+class SharedCacheParentSerializer(serializers.Serializer):
+    class Meta:
+        model = ModelSimpleParent
+        fields = ['name']
+        cache = True
+        cache_alias = 'default'
+
+
+class TestDjangoCacheBackend(TestCase):
+
+    def test_serialization_uses_django_cache(self):
+        SharedCacheParentSerializer.clear_cache()
+        ModelSimpleParent.objects.create(name='Parent')
+
+        SharedCacheParentSerializer().serialize('normal')
+        with self.assertNumQueries(0):
+            SharedCacheParentSerializer().serialize('normal')
+
+        ModelSimpleParent.objects.create(name='Parent2')
+
+        self.assertEqual(
+            [{'name': 'Parent'}, {'name': 'Parent2'}],
+            SharedCacheParentSerializer().serialize('normal')
+        )
+        self.assertEqual(SharedCacheParentSerializer.cache_info(), {'hits': 1, 'misses': 2, 'entries': None})
+
+
+class SharedCacheStatusSerializer(serializers.Serializer):
+    class Meta:
+        model = ModelStatus
+        fields = ['name']
+        cache = True
+        cache_alias = 'default'
+
+
+class TestSharedCacheInvalidation(TestCase):
+
+    def test_writes_invalidate_without_reads(self):
+        # A process that only writes must still bump the shared generation read by the other processes
+        key = get_generation_key(ModelStatus)
+        generation = caches['default'].get(key, 0)
+
+        ModelStatus.objects.create(name='Status', status='open')
+
+        self.assertEqual(caches['default'].get(key), generation + 1)
@@ -0,0 +1,192 @@
+import io
+import json
+import os
+import tempfile
+
+from django.test import TestCase
+
+from serializer import encoders, serializers
+
+from serializer.tests.models import BasicModel, ModelChild, ModelSimpleParent, ModelStatus
+from serializer.tests.test_model_serializer import BasicSerializer, ChildSerializer, StatusSerializer
+
+
+class TestJsonEncoder(TestCase):
+
+    def setUp(self):
+        parent = ModelSimpleParent.objects.create(name='Parent')
+        ModelChild.objects.create(name='Child "quoted"', related=parent)
+        ModelChild.objects.create(name='Child2 ç', related=parent)
+
+    def test_normal_dump_matches_json_dumps(self):
+        expected = json.dumps(ChildSerializer().serialize('normal'))
+
+        fp = io.StringIO()
+        ChildSerializer().dump(fp, 'normal')
+
+        self.assertEqual(expected, fp.getvalue())
+
+    def test_split_dump_matches_json_dumps(self):
+        expected = json.dumps(ChildSerializer().serialize('split'))
+
+        fp = io.StringIO()
+        ChildSerializer().dump(fp, 'split')
+
+        self.assertEqual(expected, fp.getvalue())
+
+    def test_empty_dump_matches_json_dumps(self):
+        fp = io.StringIO()
+        BasicSerializer().dump(fp, 'normal')
+
+        self.assertEqual('[]', fp.getvalue())
+
+    def test_invalid_format(self):
+        with self.assertRaises(Exception):
+            ChildSerializer().dump(io.StringIO(), 'normal', format='invalid')
+
+
+class TestNdjsonEncoder(TestCase):
+
+    def test_split_dump(self):
+        BasicModel.objects.create(name='Basic')
+        BasicModel.objects.create(name='Basic2')
+
+        fp = io.StringIO()
+        BasicSerializer().dump(fp, 'split', format='ndjson')
+
+        self.assertEqual('["name"]\n["Basic"]\n["Basic2"]\n', fp.getvalue())
+
+    def test_streaming_response(self):
+        BasicModel.objects.create(name='Basic')
+
+        response = BasicSerializer().streaming_response('normal', format='ndjson')
+
+        self.assertEqual('application/x-ndjson', response['Content-Type'])
+        self.assertEqual(b'{"name": "Basic"}\n', b''.join(response.streaming_content))
+
+
+class TestBinaryEncoders(TestCase):
+
+    def setUp(self):
+        parent = ModelSimpleParent.objects.create(name='Parent')
+        ModelChild.objects.create(name='Child ç', related=parent)
+        ModelChild.objects.create(name='Child2', related=parent)
+
+    def test_packed_values_round_trip(self):
+        values = [None, True, False, 0, -1, 2 ** 63, 1.5, '', 'ç', b'\x00', [1, ['a']], {'key': [None]}]
+
+        out = bytearray(encoders.PACKED_MAGIC)
+        for value in values:
+            encoders.pack_value(value, out)
+
+        self.assertEqual(values, list(encoders.iter_packed_values(bytes(out))))
+
+    def test_packed_is_smaller_than_json(self):
+        json_fp = io.StringIO()
+        ChildSerializer().dump(json_fp, 'split')
+
+        packed_fp = io.BytesIO()
+        ChildSerializer().dump(packed_fp, 'split', format='packed')
+
+        self.assertLess(len(packed_fp.getvalue()), len(json_fp.getvalue().encode()))
+
+    def test_load_round_trip(self):
+        formats = ['json', 'ndjson', 'packed'] + (['msgpack'] if encoders.msgpack else [])
+
+        expected = ChildSerializer().serialize('split')['data']
+
+        for format in formats:
+            fp = io.BytesIO() if format in ['packed', 'msgpack'] else io.StringIO()
+            ChildSerializer().dump(fp, 'split', format=format)
+            fp.seek(0)
+
+            ModelChild.objects.all().delete()
+            ChildSerializer().load(fp, 'split', format=format, bulk=True)
+
+            self.assertEqual(expected, ChildSerializer().serialize('split')['data'])
+
+    def test_register_encoder(self):
+        def encode_names(serializer, mode, chunk_size):
+            for row in serializer.iter_serialize('normal', chunk_size):
+                yield row['name'] + '\n'
+
+        encoders.register_encoder('names', encode_names, 'text/plain')
+        try:
+            fp = io.StringIO()
+            ChildSerializer().dump(fp, 'normal', format='names')
+
+            self.assertEqual('Child ç\nChild2\n', fp.getvalue())
+
+            with self.assertRaises(Exception):
+                ChildSerializer().load(io.StringIO(''), 'normal', format='names')
+        finally:
+            del encoders.ENCODERS['names']
+
+
+class TestCreateFromFile(TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def write(self, name, content):
+        path = os.path.join(self.directory, name)
+        with open(path, 'wb') as fp:
+            fp.write(content)
+
+        return path
+
+    def test_formats(self):
+        BasicModel.objects.bulk_create([BasicModel(name=f'Basic{i}') for i in range(25)])
+        expected = BasicSerializer().serialize('split')['data']
+
+        formats = ['ndjson', 'packed'] + (['msgpack'] if encoders.msgpack else [])
+
+        for format in formats:
+            for mode in ['split', 'normal']:
+                content = encoders.encode_all(BasicSerializer(), mode, format)
+                path = self.write(f'{mode}.{format}', content if isinstance(content, bytes) else content.encode())
+
+                BasicModel.objects.all().delete()
+                created = BasicSerializer().create_from_file(path, mode, format, batch_size=10)
+
+                self.assertEqual(created, 25)
+                self.assertEqual(expected, BasicSerializer().serialize('split')['data'])
+
+    def test_errors_in_a_later_batch_roll_back(self):
+        lines = [json.dumps(['name', 'status', 'amount'])]
+        lines += [json.dumps([f'Valid{i}', 'open', i]) for i in range(10)]
+        lines += [json.dumps(['Invalid', 'unknown', 1]), json.dumps(['Valid', 'closed', 'x'])]
+        path = self.write('status.ndjson', '\n'.join(lines).encode())
+
+        with self.assertRaises(serializers.InvalidData) as context:
+            StatusSerializer().create_from_file(path, batch_size=4)
+
+        self.assertEqual(
+            [(error['row'], error['field']) for error in context.exception.errors],
+            [(10, 'status'), (11, 'amount')]
+        )
+        self.assertEqual(ModelStatus.objects.count(), 0)
+
+    def test_unreadable_format(self):
+        path = self.write('basic.json', b'{}')
+
+        with self.assertRaises(Exception):
+            BasicSerializer().create_from_file(path, format='json')
+
+
+class TestRecordEncoding(TestCase):
+
+    def test_records_encode_as_dicts(self):
+        parent = ModelSimpleParent.objects.create(name='Parent')
+        ModelChild.objects.create(name='Child', related=parent)
+
+        expected = ChildSerializer().serialize('normal')
+
+        fp = io.StringIO()
+        ChildSerializer().dump(fp, 'record')
+        self.assertEqual(expected, json.loads(fp.getvalue()))
+
+        packed = encoders.encode_all(ChildSerializer(), 'record', 'packed')
+        self.assertEqual(expected, list(encoders.iter_packed_values(packed)))
@@ -0,0 +1,88 @@
+from django.test import TestCase
+
+from serializer import serializers
+from serializer.tests.models import BasicModel, ModelChild, ModelSimpleParent
+from serializer.tests.test_model_serializer import ChildSerializer
+
+
+class ProfiledBasicSerializer(serializers.Serializer):
+    class Meta:
+        model = BasicModel
+        fields = ['name']
+        instrument = True
+
+    def representation_name(self, name):
+        return name.upper()
+
+
+class TestInstrumentation(TestCase):
+
+    def setUp(self):
+        parent = ModelSimpleParent.objects.create(name='Parent')
+        ModelChild.objects.create(name='Child', related=parent)
+        ModelChild.objects.create(name='Child2', related=parent)
+
+    def test_disabled_by_default(self):
+        serializer = ChildSerializer()
+        serializer.serialize('split')
+
+        self.assertIsNone(serializer.last_report)
+
+    def test_context_manager(self):
+        reports = []
+        serializer = ChildSerializer(ModelChild.objects.prefetch_related('related'))
+
+        with serializer.profile(reports.append) as profile:
+            serializer.serialize('normal')
+            list(serializer.iter_serialize('split'))
+
+        report = profile.report()
+
+        self.assertEqual([report], reports)
+        self.assertEqual(report, serializer.last_report)
+        self.assertEqual(report['rows'], 4)
+        self.assertEqual(report['queries'], 2)
+        self.assertGreater(report['query_time'], 0)
+        self.assertEqual(set(report['phases']), {'serialize', 'fetch'})
+        self.assertEqual(set(report['hooks']), {'related'})
+
+    def test_sparse_serialization(self):
+        serializer = ChildSerializer(ModelChild.objects.prefetch_related('related'))
+
+        with serializer.profile() as profile:
+            serializer.serialize('normal', only=['name'])
+            list(serializer.iter_serialize('split', exclude=['name']))
+
+        report = profile.report()
+
+        self.assertEqual(report, serializer.last_report)
+        self.assertEqual(report['rows'], 4)
+        self.assertEqual(set(report['phases']), {'serialize', 'fetch'})
+        self.assertEqual(set(report['hooks']), {'related'})
+
+    def test_meta_instrument(self):
+        BasicModel.objects.create(name='Basic')
+
+        serializer = ProfiledBasicSerializer()
+        self.assertEqual(serializer.serialize('split')['data'], [['BASIC']])
+
+        report = serializer.last_report
+        self.assertEqual(report['rows'], 1)
+        self.assertEqual(report['queries'], 1)
+        self.assertEqual(set(report['hooks']), {'name'})
+        self.assertGreaterEqual(report['phases']['serialize'], report['phases']['fetch'])
+
+    def test_creation(self):
+        serializer = ChildSerializer()
+        data = [{'name': 'Child3', 'related': {'name': 'Parent2'}}]
+
+        with serializer.profile():
+            serializer.create(data, 'normal', bulk=True)
+
+        self.assertEqual(set(serializer.last_report['phases']), {'create', 'create_related.related'})
+        self.assertGreater(serializer.last_report['queries'], 0)
+
+        # Calls made after the context are not profiled
+        serializer.serialize('split')
+        self.assertEqual(set(serializer.last_report['phases']), {'create', 'create_related.related'})
+        self.assertEqual(serializer.related_serializers['related'].represent_chunk.__name__, 'represent_chunk')
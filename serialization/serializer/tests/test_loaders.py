@@ -0,0 +1,76 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from serializer import loaders, serializers
+from serializer.tests.models import BasicModel, ModelChild, ModelSimpleParent, ModelStatus
+from serializer.tests.test_model_serializer import ChildSerializer, DeltaBasicSerializer, StatusSerializer
+
+
+class TestNativeLoading(TestCase):
+
+    def test_loader_is_chosen_by_vendor(self):
+        self.assertIs(loaders.get_loader(connection), loaders.executemany_loader)
+
+        for vendor, loader in [('postgresql', loaders.copy_loader), ('oracle', loaders.executemany_loader)]:
+            self.assertIs(loaders.get_loader(mock.Mock(vendor=vendor)), loader)
+
+    def test_split_creation(self):
+        obj_data = {
+            'model': ['name', 'related'],
+            'data': [[f'Child{i}', [f'Parent{i % 2}']] for i in range(5)]
+        }
+
+        created = ChildSerializer().create(obj_data, 'split', native=True, batch_size=2)
+
+        self.assertEqual(created, 5)
+        self.assertEqual(ModelSimpleParent.objects.count(), 2)
+        self.assertEqual(
+            ChildSerializer(ModelChild.objects.order_by('pk')).serialize('split')['data'],
+            [[f'Child{i}', [f'Parent{i % 2}']] for i in range(5)]
+        )
+
+    def test_explicit_primary_keys_are_kept(self):
+        obj_data = {'model': ['id', 'name'], 'data': [[100, 'Explicit'], [None, 'Auto'], [200, 'Explicit2']]}
+
+        DeltaBasicSerializer().create(obj_data, 'split', native=True)
+
+        self.assertEqual(
+            list(BasicModel.objects.filter(name__startswith='Explicit').order_by('name').values_list('id', 'name')),
+            [(100, 'Explicit'), (200, 'Explicit2')]
+        )
+        self.assertTrue(BasicModel.objects.filter(name='Auto', id__isnull=False).exists())
+
+    def test_rows_share_one_statement(self):
+        obj_data = {'model': ['name', 'status', 'amount'], 'data': [['A', 'open', 1], ['B', 'closed', None]]}
+
+        with CaptureQueriesContext(connection) as context:
+            StatusSerializer().create(obj_data, 'split', native=True, validate=False)
+
+        # Django logs an executemany once, prefixed with its number of rows
+        inserts = [query['sql'] for query in context.captured_queries if 'INSERT' in query['sql']]
+        self.assertEqual(len(inserts), 1)
+        self.assertTrue(inserts[0].startswith('2 times: INSERT INTO "tests_modelstatus"'))
+        self.assertEqual(ModelStatus.objects.count(), 2)
+
+    def test_errors_are_reported_like_the_orm_path(self):
+        obj_data = {'model': ['name', 'status', 'amount'], 'data': [['Valid', 'open', 1], ['Invalid', 'other', 2]]}
+
+        with self.assertRaises(serializers.InvalidData) as context:
+            StatusSerializer().create(obj_data, 'split', native=True)
+
+        self.assertEqual([(error['row'], error['field']) for error in context.exception.errors], [(1, 'status')])
+        self.assertEqual(ModelStatus.objects.count(), 0)
+
+    def test_copy_text(self):
+        values = [None, True, 'tab\there\\', b'\x01\xff', 1.5]
+
+        self.assertEqual(
+            [loaders.to_copy_text(value) for value in values],
+            ['\\N', 't', 'tab\\there\\\\', '\\\\x01ff', '1.5']
+        )
+
+        with self.assertRaises(Exception):
+            loaders.to_copy_text([1])
@@ -1,7 +1,16 @@
+import pickle
+import sys
+from datetime import timedelta
+from itertools import islice
+from unittest import mock
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 
 from serializer import serializers
-from serializer.tests.models import BasicModel, ModelChild, ModelSimpleParent
+from serializer.tests.models import BasicModel, ModelChild, ModelEvent, ModelNumeric, ModelSimpleParent, ModelStatus
 
 
 class BasicSerializer(serializers.Serializer):
@@ -20,6 +29,10 @@ class TestSerializer(TestCase):
         self.assertEqual(BasicModel, basic_expected.model)
         self.assertEqual(expected_fields, basic_expected.fields)
 
+    def test_model_fields_are_shared_by_serializers(self):
+        self.assertIs(BasicSerializer.foo['name']['model_field'], CustomBasicSerializer.foo['name']['model_field'])
+        self.assertIs(BasicSerializer().model_fields, BasicSerializer().model_fields)
+
     def test_single_normal_serialization(self):
         basic_instance = BasicModel.objects.create(name="Basic")
         serializer = BasicSerializer(basic_instance)
@@ -47,6 +60,46 @@ class TestSerializer(TestCase):
 
         self.assertEqual(expected, result)
 
+    def test_queryset_serialization_skips_model_instantiation(self):
+        BasicModel.objects.create(name="Basic")
+
+        serializer = BasicSerializer(BasicModel.objects.all())
+
+        with mock.patch.object(BasicModel, 'from_db') as from_db, self.assertNumQueries(1):
+            result = serializer.serialize(mode="split")
+
+        from_db.assert_not_called()
+        self.assertEqual({'model': ['name'], 'data': [['Basic']]}, result)
+
+    def test_iter_normal_serialization(self):
+        BasicModel.objects.create(name="Basic")
+        BasicModel.objects.create(name="Basic2")
+
+        serializer = BasicSerializer()
+
+        with self.assertNumQueries(0):
+            rows = serializer.iter_serialize(mode="normal", chunk_size=1)
+
+        self.assertEqual([{'name': 'Basic'}, {'name': 'Basic2'}], list(rows))
+        self.assertIsNone(serializer.data._result_cache)
+
+    def test_iter_split_serialization(self):
+        BasicModel.objects.create(name="Basic")
+        BasicModel.objects.create(name="Basic2")
+
+        serializer = BasicSerializer()
+
+        rows = serializer.iter_serialize(mode="split")
+
+        self.assertEqual(['name'], next(rows))
+        self.assertEqual([['Basic'], ['Basic2']], list(rows))
+
+    def test_invalid_iter_serialization_mode(self):
+        serializer = BasicSerializer()
+
+        with self.assertRaises(Exception):
+            serializer.iter_serialize('mode invalid')
+
     def test_invalid_serialization_mode(self):
         serializer = BasicSerializer()
 
@@ -175,6 +228,299 @@ class TestSerializer(TestCase):
         self.assertEqual(len(all_objs), 0)
 
 
+class TestBulkCreation(TestCase):
+
+    def test_split_bulk_creation(self):
+        serializer = BasicSerializer()
+
+        obj_data = {
+            'model': ['name'],
+            'data': [['Bulk'], ['Bulk2'], ['Bulk3']]
+        }
+
+        with self.assertNumQueries(4):
+            serializer.create(obj_data, 'split', bulk=True, batch_size=2)
+
+        names = list(BasicModel.objects.values_list('name', flat=True))
+        self.assertEqual(names, ['Bulk', 'Bulk2', 'Bulk3'])
+
+    def test_normal_bulk_creation(self):
+        serializer = BasicSerializer()
+
+        obj_data = [
+            {'name': 'Bulk'},
+            {'name': 'Bulk2'},
+        ]
+
+        serializer.create(obj_data, 'normal', bulk=True)
+
+        names = list(BasicModel.objects.values_list('name', flat=True))
+        self.assertEqual(names, ['Bulk', 'Bulk2'])
+
+    def test_bulk_creation_above_statement_limits(self):
+        obj_data = {
+            'model': ['name'],
+            'data': [[f'Bulk{i}'] for i in range(1200)]
+        }
+
+        BasicSerializer().create(obj_data, 'split', bulk=True)
+
+        self.assertEqual(BasicModel.objects.count(), 1200)
+
+    def test_invalid_split_bulk_creation(self):
+        serializer = BasicSerializer()
+
+        obj_data = {
+            'model': ['nam'],
+            'data': [['Bulk']]
+        }
+
+        with self.assertRaises(Exception):
+            serializer.create(obj_data, 'split', bulk=True)
+
+        self.assertEqual(BasicModel.objects.count(), 0)
+
+
+class NumericSerializer(serializers.Serializer):
+    class Meta:
+        model = ModelNumeric
+        fields = ['name', 'count', 'ratio', 'active', 'score']
+
+
+class TestColumnarSerializer(TestCase):
+
+    def test_columnar_serialization(self):
+        ModelNumeric.objects.create(name='First', count=1, ratio=0.5, active=True, score=None)
+        ModelNumeric.objects.create(name='Second', count=2, ratio=1.5, active=False, score=10)
+
+        result = NumericSerializer().serialize('columnar')
+        columns = result['columns']
+
+        self.assertEqual(result['model'], ['name', 'count', 'ratio', 'active', 'score'])
+        self.assertEqual(columns['name'], ['First', 'Second'])
+        self.assertEqual(list(columns['count']), [1, 2])
+        self.assertEqual(list(columns['ratio']), [0.5, 1.5])
+        self.assertEqual([bool(value) for value in columns['active']], [True, False])
+        self.assertEqual(columns['score'], [None, 10])
+        self.assertFalse(isinstance(columns['count'], list))
+
+    def test_columnar_creation(self):
+        ModelNumeric.objects.create(name='First', count=1, ratio=0.5, active=True, score=None)
+        ModelNumeric.objects.create(name='Second', count=2, ratio=1.5, active=False, score=10)
+
+        serializer = NumericSerializer()
+        result = serializer.serialize('columnar')
+        expected = serializer.serialize('split')['data']
+
+        ModelNumeric.objects.all().delete()
+        serializer.create(result, 'columnar')
+
+        self.assertEqual(NumericSerializer().serialize('split')['data'], expected)
+
+    def test_invalid_columnar_creation(self):
+        serializer = NumericSerializer()
+
+        with self.assertRaises(Exception):
+            serializer.create({'model': NumericSerializer.fields, 'columns': {'name': []}}, 'columnar')
+
+
+class SyncNumericSerializer(serializers.Serializer):
+    class Meta:
+        model = ModelNumeric
+        fields = ['name', 'count', 'ratio', 'active', 'score']
+        key_fields = ['name']
+
+
+class SyncNumericWithIdSerializer(serializers.Serializer):
+    class Meta:
+        model = ModelNumeric
+        fields = ['id', 'name', 'count', 'ratio', 'active', 'score']
+        key_fields = ['name']
+
+
+class TestSyncCreation(TestCase):
+
+    def setUp(self):
+        ModelNumeric.objects.create(name='Unchanged', count=1, ratio=0.5, active=True, score=None)
+        ModelNumeric.objects.create(name='Changed', count=2, ratio=1.5, active=False, score=10)
+        ModelNumeric.objects.create(name='Missing', count=3, ratio=2.5, active=False, score=None)
+
+    def get_obj_data(self):
+        return {
+            'model': ['name', 'count', 'ratio', 'active', 'score'],
+            'data': [
+                ['Unchanged', 1, 0.5, True, None],
+                ['Changed', 20, 1.5, False, 11],
+                ['New', 4, 3.5, True, None],
+            ]
+        }
+
+    def test_sync_creation(self):
+        summary = SyncNumericSerializer().create(self.get_obj_data(), 'sync')
+
+        self.assertEqual(summary, {'created': 1, 'updated': 1, 'unchanged': 1, 'deleted': 0})
+        self.assertEqual(
+            SyncNumericSerializer(ModelNumeric.objects.order_by('name')).serialize('split')['data'],
+            [
+                ['Changed', 20, 1.5, False, 11],
+                ['Missing', 3, 2.5, False, None],
+                ['New', 4, 3.5, True, None],
+                ['Unchanged', 1, 0.5, True, None],
+            ]
+        )
+
+    def test_sync_creation_delete_missing(self):
+        summary = SyncNumericSerializer().create(self.get_obj_data(), 'sync', delete_missing=True, batch_size=2)
+
+        self.assertEqual(summary, {'created': 1, 'updated': 1, 'unchanged': 1, 'deleted': 1})
+        self.assertEqual(
+            sorted(ModelNumeric.objects.values_list('name', flat=True)),
+            ['Changed', 'New', 'Unchanged']
+        )
+
+    def test_unchanged_sync_does_not_write(self):
+        SyncNumericSerializer().create(self.get_obj_data(), 'sync')
+
+        with self.assertNumQueries(3):
+            summary = SyncNumericSerializer().create(self.get_obj_data(), 'sync')
+
+        self.assertEqual(summary, {'created': 0, 'updated': 0, 'unchanged': 3, 'deleted': 0})
+
+    def test_sync_creation_with_the_primary_key_as_a_field(self):
+        pks = dict(ModelNumeric.objects.values_list('name', 'pk'))
+        obj_data = {
+            'model': ['id', 'name', 'count', 'ratio', 'active', 'score'],
+            'data': [
+                [pks['Unchanged'], 'Unchanged', 1, 0.5, True, None],
+                [None, 'Missing', 3, 2.5, False, None],
+                [None, 'Changed', 20, 1.5, False, 11],
+                [None, 'New', 4, 3.5, True, None],
+            ]
+        }
+
+        summary = SyncNumericWithIdSerializer().create(obj_data, 'sync')
+
+        self.assertEqual(summary, {'created': 1, 'updated': 1, 'unchanged': 2, 'deleted': 0})
+        self.assertEqual(
+            list(ModelNumeric.objects.filter(pk__in=pks.values()).order_by('name').values_list('pk', 'count')),
+            [(pks['Changed'], 20), (pks['Missing'], 3), (pks['Unchanged'], 1)]
+        )
+        self.assertTrue(ModelNumeric.objects.filter(name='New').exists())
+
+    def test_sync_creation_requires_key_fields(self):
+        with self.assertRaises(Exception):
+            NumericSerializer().create(self.get_obj_data(), 'sync')
+
+
+class StatusSerializer(serializers.Serializer):
+    class Meta:
+        model = ModelStatus
+        fields = ['name', 'status', 'amount']
+
+
+class TestCreationValidation(TestCase):
+
+    def test_all_errors_are_reported_before_writing(self):
+        obj_data = {
+            'model': ['name', 'status', 'amount'],
+            'data': [
+                ['Valid', 'open', 1],
+                ['Too long name', 'open', 2],
+                [None, 'unknown', 'three'],
+                ['Valid2', 'closed', None],
+            ]
+        }
+
+        for bulk in [False, True]:
+            with self.assertRaises(serializers.InvalidData) as context:
+                StatusSerializer().create(dict(obj_data), 'split', bulk=bulk)
+
+            self.assertEqual(
+                [(error['row'], error['field']) for error in context.exception.errors],
+                [(1, 'name'), (2, 'name'), (2, 'status'), (2, 'amount')]
+            )
+            self.assertEqual(ModelStatus.objects.count(), 0)
+
+    def test_auto_primary_keys_can_be_empty(self):
+        obj_data = {'model': ['id', 'name'], 'data': [[None, 'Auto'], [None, 'Auto2']]}
+
+        for bulk in [False, True]:
+            DeltaBasicSerializer().create(dict(obj_data), 'split', bulk=bulk)
+
+        self.assertEqual(BasicModel.objects.filter(id__isnull=False).count(), 4)
+
+    def test_values_are_coerced(self):
+        StatusSerializer().create([{'name': 'Coerced', 'status': 'open', 'amount': '5'}], 'normal', bulk=True)
+
+        self.assertEqual(ModelStatus.objects.get().amount, 5)
+
+    def test_nested_payloads_are_validated(self):
+        data = [
+            {'name': 'Child', 'related': {'name': 'Parent'}},
+            {'name': 'Child2', 'related': {'name': 'P' * 101}},
+        ]
+
+        with self.assertRaises(serializers.InvalidData) as context:
+            ChildSerializer().create(data, 'normal')
+
+        self.assertEqual(context.exception.errors[0]['row'], 1)
+        self.assertEqual(context.exception.errors[0]['field'], 'related')
+        self.assertEqual(ModelChild.objects.count(), 0)
+        self.assertEqual(ModelSimpleParent.objects.count(), 0)
+
+
+class DeltaBasicSerializer(serializers.Serializer):
+    class Meta:
+        model = BasicModel
+        fields = ['id', 'name']
+        watermark = 'id'
+
+
+class TestDeltaSerialization(TestCase):
+
+    def test_delta_serialization(self):
+        first = BasicModel.objects.create(name='Basic')
+        second = BasicModel.objects.create(name='Basic2')
+
+        delta = DeltaBasicSerializer().serialize('delta')
+
+        self.assertEqual(delta['data'], [[first.id, 'Basic'], [second.id, 'Basic2']])
+        self.assertEqual(delta['watermark'], second.id)
+
+        third = BasicModel.objects.create(name='Basic3')
+
+        delta = DeltaBasicSerializer().serialize('delta', since=delta['watermark'])
+
+        self.assertEqual(delta, {'model': ['id', 'name'], 'data': [[third.id, 'Basic3']], 'watermark': third.id})
+
+    def test_empty_delta_keeps_watermark(self):
+        basic = BasicModel.objects.create(name='Basic')
+
+        with self.assertNumQueries(1):
+            delta = DeltaBasicSerializer().serialize('delta', since=basic.id)
+
+        self.assertEqual(delta['data'], [])
+        self.assertEqual(delta['watermark'], basic.id)
+
+    def test_delta_removed(self):
+        first = BasicModel.objects.create(name='Basic')
+        second = BasicModel.objects.create(name='Basic2')
+        first_id = first.id
+        first.delete()
+
+        delta = DeltaBasicSerializer().serialize('delta', since=second.id, known=[first_id, second.id])
+
+        self.assertEqual(delta['removed'], [first_id])
+
+        delta = DeltaBasicSerializer().serialize('delta', known=(pk for pk in [first_id, second.id]))
+
+        self.assertEqual(delta['removed'], [first_id])
+
+    def test_delta_requires_watermark(self):
+        with self.assertRaises(Exception):
+            BasicSerializer().serialize('delta')
+
+
 # Representation tests
 
 
@@ -190,6 +536,11 @@ class CustomBasicSerializer(serializers.Serializer):
 
 class TestCustomSerializer(TestCase):
 
+    def test_only_fields_with_representation_are_compiled(self):
+        self.assertEqual(BasicSerializer.representations, ())
+        self.assertEqual(len(CustomBasicSerializer.representations), 1)
+        self.assertEqual(CustomBasicSerializer.representations[0][0], 0)
+
     def test_single_normal_serialization(self):
         basic_instance = BasicModel.objects.create(name="Model")
         serializer = CustomBasicSerializer(basic_instance)
@@ -216,6 +567,91 @@ class TestCustomSerializer(TestCase):
         self.assertEqual(expected, result)
 
 
+class MemoizedBasicSerializer(serializers.Serializer):
+    calls = []
+
+    @serializers.memoized_representation(maxsize=16)
+    def representation_name(self, name):
+        self.calls.append(name)
+        return name.upper()
+
+    class Meta:
+        model = BasicModel
+        fields = ['name']
+
+
+class MetaMemoizedBasicSerializer(serializers.Serializer):
+    calls = []
+
+    def representation_name(self, name):
+        self.calls.append(name)
+        return name.upper()
+
+    class Meta:
+        model = BasicModel
+        fields = ['name']
+        memoize_representations = True
+
+
+class BatchBasicSerializer(serializers.Serializer):
+    calls = []
+
+    @serializers.batch_representation
+    def representation_name(self, names):
+        self.calls.append(names)
+        return {name: name.upper() for name in names}
+
+    class Meta:
+        model = BasicModel
+        fields = ['name']
+
+
+class TestRepresentationMemoization(TestCase):
+
+    def setUp(self):
+        for name in ['a', 'b', 'a', 'a', 'b']:
+            BasicModel.objects.create(name=name)
+
+    def test_memoized_representation(self):
+        for serializer_class in [MemoizedBasicSerializer, MetaMemoizedBasicSerializer]:
+            serializer_class.calls.clear()
+
+            result = serializer_class().serialize('split')
+
+            self.assertEqual(result['data'], [['A'], ['B'], ['A'], ['A'], ['B']])
+            self.assertEqual(serializer_class.calls, ['a', 'b'])
+
+    def test_memoization_is_per_serialization(self):
+        MemoizedBasicSerializer.calls.clear()
+        serializer = MemoizedBasicSerializer()
+
+        serializer.serialize('normal')
+        serializer.serialize('normal')
+
+        self.assertEqual(MemoizedBasicSerializer.calls, ['a', 'b', 'a', 'b'])
+
+    def test_batch_representation(self):
+        BatchBasicSerializer.calls.clear()
+
+        result = BatchBasicSerializer().serialize('normal')
+
+        self.assertEqual([row['name'] for row in result], ['A', 'B', 'A', 'A', 'B'])
+        self.assertEqual(BatchBasicSerializer.calls, [['a', 'b']])
+
+    def test_batch_representation_per_chunk(self):
+        BatchBasicSerializer.calls.clear()
+
+        result = list(BatchBasicSerializer().iter_serialize('split', chunk_size=3))
+
+        self.assertEqual(result, [['name'], ['A'], ['B'], ['A'], ['A'], ['B']])
+        self.assertEqual(BatchBasicSerializer.calls, [['a', 'b'], ['a', 'b']])
+
+    def test_batch_representation_single_instance(self):
+        instance = BasicModel.objects.first()
+
+        self.assertEqual(BatchBasicSerializer(instance).serialize('normal'), [{'name': 'A'}])
+
+
 # Relations tests
 
 
@@ -233,6 +669,90 @@ class ChildSerializer(serializers.Serializer):
         fields = ['name', 'related']
 
 
+class ParentWithIdSerializer(serializers.Serializer):
+    class Meta:
+        model = ModelSimpleParent
+        fields = ['id', 'name']
+
+
+class ChildWithParentIdSerializer(serializers.Serializer):
+    related = ParentWithIdSerializer
+
+    class Meta:
+        model = ModelChild
+        fields = ['name', 'related']
+
+
+class MemoizedParentSerializer(serializers.Serializer):
+    calls = []
+
+    @serializers.memoized_representation(maxsize=16)
+    def representation_name(self, name):
+        self.calls.append(name)
+        return name.upper()
+
+    class Meta:
+        model = ModelSimpleParent
+        fields = ['name']
+
+
+class BatchParentSerializer(serializers.Serializer):
+    calls = []
+
+    @serializers.batch_representation
+    def representation_name(self, names):
+        self.calls.append(names)
+        return {name: name.upper() for name in names}
+
+    class Meta:
+        model = ModelSimpleParent
+        fields = ['name']
+
+
+class MemoizedChildSerializer(serializers.Serializer):
+    related = MemoizedParentSerializer
+
+    class Meta:
+        model = ModelChild
+        fields = ['name', 'related']
+
+
+class BatchChildSerializer(serializers.Serializer):
+    related = BatchParentSerializer
+
+    class Meta:
+        model = ModelChild
+        fields = ['name', 'related']
+
+
+class TestNestedRepresentations(TestCase):
+
+    def setUp(self):
+        parent = ModelSimpleParent.objects.create(name='p')
+        ModelChild.objects.bulk_create([ModelChild(name=f'Child{i}', related=parent) for i in range(5)])
+
+    def test_nested_memoized_representation(self):
+        MemoizedParentSerializer.calls.clear()
+
+        result = MemoizedChildSerializer().serialize('normal')
+
+        self.assertEqual([row['related'] for row in result], [{'name': 'P'}] * 5)
+        self.assertEqual(MemoizedParentSerializer.calls, ['p'])
+
+    def test_nested_batch_representation_per_chunk(self):
+        BatchParentSerializer.calls.clear()
+
+        self.assertEqual([row[1] for row in BatchChildSerializer().serialize('split')['data']], [['P']] * 5)
+        self.assertEqual(BatchParentSerializer.calls, [['p']])
+
+        BatchParentSerializer.calls.clear()
+
+        rows = list(BatchChildSerializer().iter_serialize('record', chunk_size=2))
+
+        self.assertEqual([row.related.name for row in rows], ['P'] * 5)
+        self.assertEqual(BatchParentSerializer.calls, [['p'], ['p'], ['p']])
+
+
 class TestRelationsSerializer(TestCase):
 
     def test_single_normal_serialization(self):
@@ -244,7 +764,9 @@ class TestRelationsSerializer(TestCase):
         expected = [
             {
                 'name': 'Child',
-                'related': 1
+                'related': {
+                    'name': 'Parent'
+                }
             }
         ]
 
@@ -254,7 +776,7 @@ class TestRelationsSerializer(TestCase):
 
     def test_multiple_normal_serialization(self):
         parent = ModelSimpleParent.objects.create(name='Parent')
-        parent2 = ModelSimpleParent.objects.create(name='Parent')
+        parent2 = ModelSimpleParent.objects.create(name='Parent2')
 
         ModelChild.objects.create(name='ChildParent', related=parent)
         ModelChild.objects.create(name='ChildParent2', related=parent2)
@@ -265,15 +787,15 @@ class TestRelationsSerializer(TestCase):
         expected = [
             {
                 'name': 'ChildParent',
-                'related': 1
+                'related': {'name': 'Parent'}
             },
             {
                 'name': 'ChildParent2',
-                'related': 2
+                'related': {'name': 'Parent2'}
             },
             {
                 'name': 'Child2Parent2',
-                'related': 2
+                'related': {'name': 'Parent2'}
             }
         ]
 
@@ -289,7 +811,7 @@ class TestRelationsSerializer(TestCase):
 
         expected = {
             'model': ['name', 'related'],
-            'data': [['Child', 1]]
+            'data': [['Child', ['Parent']]]
         }
 
         result = child_serializer.serialize('split')
@@ -297,7 +819,7 @@ class TestRelationsSerializer(TestCase):
 
     def test_multiple_split_serialization(self):
         parent = ModelSimpleParent.objects.create(name='Parent')
-        parent2 = ModelSimpleParent.objects.create(name='Parent')
+        parent2 = ModelSimpleParent.objects.create(name='Parent2')
 
         ModelChild.objects.create(name='ChildParent', related=parent)
         ModelChild.objects.create(name='ChildParent2', related=parent2)
@@ -308,9 +830,9 @@ class TestRelationsSerializer(TestCase):
         expected = {
             'model': ['name', 'related'],
             'data': [
-                ['ChildParent', 1],
-                ['ChildParent2', 2],
-                ['Child2Parent2', 2]
+                ['ChildParent', ['Parent']],
+                ['ChildParent2', ['Parent2']],
+                ['Child2Parent2', ['Parent2']]
             ]
         }
 
@@ -342,21 +864,300 @@ class TestRelationsSerializer(TestCase):
         self.assertEqual(len(parent_objs), 1)
         self.assertEqual(parent_first.name, 'ParentName')
 
-    # def test_single_normal_serialization_with_related(self):
-    #     parent = ModelSimpleParent.objects.create(name='Parent')
-    #     child = ModelChild.objects.create(name='Child', related=parent)
-    #
-    #     child_related_serializer = ChildSerializer(child)
-    #
-    #     expected = [
-    #         {
-    #             'name': 'Child',
-    #             'related': {
-    #                 'name'
-    #             }
-    #         }
-    #     ]
-    #
-    #     result = child_related_serializer.serialize('normal')
-    #
-    #     self.assertEqual(expected, result)
+    def test_serialization_query_count_is_constant(self):
+        parent = ModelSimpleParent.objects.create(name='Parent')
+        parent2 = ModelSimpleParent.objects.create(name='Parent2')
+
+        for i in range(10):
+            ModelChild.objects.create(name=f'Child{i}', related=parent if i % 2 else parent2)
+
+        for mode in ['normal', 'split']:
+            with self.assertNumQueries(1):
+                ChildSerializer().serialize(mode)
+
+            with self.assertNumQueries(1):
+                ChildSerializer(ModelChild.objects.filter(name__startswith='Child')).serialize(mode)
+
+            with self.assertNumQueries(1):
+                list(ChildSerializer().iter_serialize(mode, chunk_size=3))
+
+    def test_select_related_plan(self):
+        self.assertEqual(ChildSerializer.select_related, ('related',))
+        self.assertEqual(ParentSimpleSerializer.select_related, ())
+
+    def test_bulk_normal_creation_deduplicates_related(self):
+        child_serializer = ChildSerializer()
+
+        data = [
+            {'name': f'Child{i}', 'related': {'name': f'Parent{i % 2}'}}
+            for i in range(10)
+        ]
+
+        # Savepoint, one INSERT per distinct parent, the children's INSERT and the release
+        with self.assertNumQueries(5):
+            child_serializer.create(data, 'normal', bulk=True)
+
+        self.assertEqual(ModelSimpleParent.objects.count(), 2)
+        self.assertEqual(
+            list(ModelChild.objects.values_list('name', 'related__name')),
+            [(f'Child{i}', f'Parent{i % 2}') for i in range(10)]
+        )
+
+    def test_bulk_creation_keeps_related_primary_keys(self):
+        data = [
+            {'name': 'Child', 'related': {'id': 50, 'name': 'Parent'}},
+            {'name': 'Child2', 'related': {'id': 60, 'name': 'Parent'}},
+        ]
+
+        ChildWithParentIdSerializer().create(data, 'normal', bulk=True)
+
+        self.assertEqual(
+            list(ModelChild.objects.order_by('name').values_list('related_id', 'related__name')),
+            [(50, 'Parent'), (60, 'Parent')]
+        )
+
+    def test_bulk_split_creation_deduplicates_related_across_batches(self):
+        ModelSimpleParent.objects.create(name='Existing')
+
+        child_serializer = ChildSerializer()
+
+        data = {
+            'model': ['name', 'related'],
+            'data': [[f'Child{i}', [f'Parent{i % 3}']] for i in range(10)]
+        }
+
+        child_serializer.create(data, 'split', bulk=True, batch_size=4)
+
+        self.assertEqual(ModelSimpleParent.objects.count(), 4)
+        self.assertEqual(
+            child_serializer.serialize('split')['data'],
+            [[f'Child{i}', [f'Parent{i % 3}']] for i in range(10)]
+        )
+
+
+class TestSparseFieldsets(TestCase):
+
+    def setUp(self):
+        parent = ModelSimpleParent.objects.create(name='Parent')
+        ModelChild.objects.create(name='Child', related=parent)
+
+    def test_only_top_level_fields(self):
+        with CaptureQueriesContext(connection) as queries:
+            result = ChildSerializer().serialize('normal', only=['name'])
+
+        self.assertEqual(result, [{'name': 'Child'}])
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('related', queries[0]['sql'])
+
+    def test_only_nested_paths(self):
+        with CaptureQueriesContext(connection) as queries:
+            result = ChildSerializer().serialize('split', only=['related__name'])
+
+        self.assertEqual(result, {'model': ['related'], 'data': [[['Parent']]]})
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"tests_modelchild"."name"', queries[0]['sql'])
+
+    def test_exclude(self):
+        self.assertEqual(ChildSerializer().serialize('normal', exclude=['related']), [{'name': 'Child'}])
+        self.assertEqual(
+            list(ChildSerializer().iter_serialize('split', exclude=['name'])),
+            [['related'], [['Parent']]]
+        )
+
+    def test_sparse_classes_are_reused(self):
+        self.assertIs(ChildSerializer.get_sparse_class(['name']), ChildSerializer.get_sparse_class(['name']))
+        self.assertEqual(ChildSerializer.get_sparse_class(['name']).fields, ['name'])
+        self.assertEqual(ChildSerializer.fields, ['name', 'related'])
+
+    def test_equivalent_selections_share_a_class(self):
+        serializer_class = ChildWithParentIdSerializer
+        sparse_class = serializer_class.get_sparse_class(['name', 'related__name'])
+
+        self.assertIs(sparse_class, serializer_class.get_sparse_class(['related__name', 'name']))
+        self.assertIs(sparse_class, serializer_class.get_sparse_class(None, ['related__id']))
+        self.assertIs(serializer_class, serializer_class.get_sparse_class(['related', 'name']))
+        self.assertEqual(sparse_class.__qualname__, 'ChildWithParentIdSerializer[name,related(name)]')
+
+    def test_sparse_classes_narrow_their_base(self):
+        serializer_class = ChildWithParentIdSerializer
+        sparse_class = serializer_class.get_sparse_class(['name', 'related__name'])
+
+        self.assertIs(sparse_class.get_sparse_class(['related']), serializer_class.get_sparse_class(['related__name']))
+        self.assertIs(sparse_class.get_sparse_class(None, ['related']), serializer_class.get_sparse_class(['name']))
+        self.assertIs(sparse_class.get_sparse_class(['name', 'related']), sparse_class)
+
+    def test_sparse_records_are_picklable(self):
+        parent = ModelSimpleParent.objects.create(name='Parent')
+        ModelChild.objects.create(name='Child', related=parent)
+
+        for only in [['name'], ['related__name'], ['name', 'related']]:
+            records = ChildWithParentIdSerializer().serialize('record', only=only)
+
+            self.assertEqual(records, pickle.loads(pickle.dumps(records)))
+
+    def test_sparse_classes_are_bounded(self):
+        with mock.patch.object(serializers, 'MAX_SPARSE_CLASSES', 2):
+            ChildWithParentIdSerializer.sparse_classes.clear()
+
+            for only in [['name'], ['related'], ['related__id'], ['related__name']]:
+                ChildWithParentIdSerializer.get_sparse_class(only)
+
+            self.assertEqual(len(ChildWithParentIdSerializer.sparse_classes), 2)
+
+    def test_representations_are_kept(self):
+        BasicModel.objects.create(name='Model')
+
+        result = CustomBasicSerializer().serialize('normal', only=['name'])
+
+        self.assertEqual(result, [{'name': 'Model_representation'}])
+
+    def test_invalid_paths(self):
+        for only, exclude in [(['invalid'], None), (['name__invalid'], None), (None, ['name', 'related'])]:
+            with self.assertRaises(Exception):
+                ChildSerializer().serialize('normal', only=only, exclude=exclude)
+
+
+class EventSerializer(serializers.Serializer):
+    class Meta:
+        model = ModelEvent
+        fields = ['name', 'created']
+
+
+class TestPagination(TestCase):
+
+    def setUp(self):
+        parent = ModelSimpleParent.objects.create(name='Parent')
+        ModelChild.objects.bulk_create([ModelChild(name=f'Child{i % 4}', related=parent) for i in range(10)])
+
+    def iter_pages(self, serializer, mode='split', **kwargs):
+        cursor = None
+
+        while True:
+            page, cursor = serializer.serialize_page(mode, after=cursor, **kwargs)
+            yield page
+
+            if cursor is None:
+                return
+
+    def test_pages_cover_the_queryset_in_order(self):
+        queryset = ModelChild.objects.order_by('-name', 'pk')
+        expected = ChildSerializer(queryset).serialize('split')['data']
+
+        pages = list(self.iter_pages(ChildSerializer(), limit=3, order_by='-name'))
+
+        self.assertEqual([len(page['data']) for page in pages], [3, 3, 3, 1])
+        self.assertEqual(expected, [row for page in pages for row in page['data']])
+
+    def test_pages_by_sub_millisecond_times(self):
+        created = timezone.now().replace(microsecond=1000)
+        ModelEvent.objects.bulk_create([
+            ModelEvent(name=f'e{i}', created=created + timedelta(microseconds=i * 100)) for i in range(6)
+        ])
+
+        for order_by, expected in [('created', ['e0', 'e1', 'e2', 'e3', 'e4', 'e5']),
+                                   ('-created', ['e5', 'e4', 'e3', 'e2', 'e1', 'e0'])]:
+            # Bounded, a cursor that does not move forward would page forever
+            pages = list(islice(self.iter_pages(EventSerializer(), mode='normal', limit=2, order_by=order_by), 4))
+
+            self.assertEqual(expected, [row['name'] for page in pages for row in page])
+
+    def test_each_page_is_a_single_query(self):
+        page, cursor = ChildSerializer().serialize_page('normal', limit=4)
+
+        with self.assertNumQueries(1):
+            page, cursor = ChildSerializer().serialize_page('normal', after=cursor, limit=4)
+
+        self.assertEqual(page[0]['related'], {'name': 'Parent'})
+
+        with self.assertNumQueries(1):
+            BasicSerializer(BasicModel.objects.all()).serialize_page(limit=4)
+
+    def test_last_page_has_no_cursor(self):
+        page, cursor = BasicSerializer().serialize_page()
+
+        self.assertEqual(page, {'model': ['name'], 'data': []})
+        self.assertIsNone(cursor)
+
+    def test_invalid_limit(self):
+        for limit in [0, -1, '10', None]:
+            with self.assertRaises(Exception) as context:
+                ChildSerializer().serialize_page(limit=limit)
+
+            self.assertNotIsInstance(context.exception, (IndexError, TypeError))
+
+    def test_invalid_cursor(self):
+        _, cursor = ChildSerializer().serialize_page(limit=2, order_by='name')
+
+        for after in ['not a cursor', cursor]:
+            with self.assertRaises(Exception):
+                ChildSerializer().serialize_page(after=after, limit=2, order_by='-name')
+
+
+class TestDictionaryEncoding(TestCase):
+
+    def setUp(self):
+        parent = ModelSimpleParent.objects.create(name='Parent')
+        ModelChild.objects.bulk_create([ModelChild(name=f'Child{i}', related=parent) for i in range(4)])
+
+    def test_encoded_columns(self):
+        split = ChildSerializer().serialize('split', dictionary=['related'])
+
+        self.assertEqual(split['dictionary'], {'related': [['Parent']]})
+        self.assertEqual([row[1] for row in split['data']], [0, 0, 0, 0])
+
+    def test_automatic_columns_must_shrink(self):
+        split = ChildSerializer().serialize('split', dictionary=True)
+
+        self.assertEqual(list(split['dictionary']), ['related'])
+        self.assertEqual(split['data'][0], ['Child0', 0])
+
+    def test_creation_decodes(self):
+        expected = ChildSerializer().serialize('split')['data']
+        split = ChildSerializer().serialize('split', dictionary=True)
+        ModelChild.objects.all().delete()
+
+        ChildSerializer().create(split, 'split', bulk=True)
+
+        self.assertEqual(expected, ChildSerializer().serialize('split')['data'])
+
+        split = {'model': ['name', 'status', 'amount'], 'data': [['A', 0, 1], ['B', 0, None]]}
+        StatusSerializer().create(dict(split, dictionary={'status': ['closed']}), 'split')
+
+        self.assertEqual(list(ModelStatus.objects.values_list('status', flat=True)), ['closed', 'closed'])
+
+    def test_invalid_dictionary(self):
+        with self.assertRaises(Exception):
+            ChildSerializer().serialize('split', dictionary=['invalid'])
+
+        split = {'model': ['name', 'related'], 'data': [['Child', 1]], 'dictionary': {'related': [['Parent']]}}
+        with self.assertRaises(Exception):
+            ChildSerializer().create(split, 'split')
+
+        self.assertEqual(ModelChild.objects.count(), 4)
+
+
+class TestRecordSerialization(TestCase):
+
+    def setUp(self):
+        parent = ModelSimpleParent.objects.create(name='Parent')
+        ModelChild.objects.bulk_create([ModelChild(name=f'Child{i}', related=parent) for i in range(3)])
+
+    def test_records_match_normal_mode(self):
+        records = ChildSerializer().serialize('record')
+
+        self.assertEqual([record.as_dict() for record in records], ChildSerializer().serialize('normal'))
+        self.assertEqual(records, list(ChildSerializer().iter_serialize('record')))
+        self.assertEqual(dict(records[0]), {'name': 'Child0', 'related': records[0].related})
+        self.assertEqual(records[0]['related'].name, 'Parent')
+
+    def test_records_have_no_dict(self):
+        record = BasicSerializer.record_class('Basic')
+
+        self.assertFalse(hasattr(record, '__dict__'))
+        self.assertLess(sys.getsizeof(record), sys.getsizeof({'name': 'Basic'}))
+        self.assertEqual(repr(record), "BasicSerializerRecord(name='Basic')")
+
+    def test_records_are_picklable(self):
+        records = ChildSerializer().serialize('record')
+
+        self.assertEqual(records, pickle.loads(pickle.dumps(records)))
@@ -0,0 +1,64 @@
+from django.db import transaction
+from django.test import TransactionTestCase
+
+from serializer.tests.models import BasicModel, ModelChild, ModelSimpleParent
+from serializer.tests.test_model_serializer import BasicSerializer, ChildSerializer
+
+
+class TestParallelSerialization(TransactionTestCase):
+
+    def setUp(self):
+        BasicModel.objects.bulk_create(BasicModel(name=f'Basic{i}') for i in range(25))
+
+    def test_normal_parallel_serialization(self):
+        expected = BasicSerializer().serialize('normal')
+
+        result = BasicSerializer().parallel_serialize('normal', workers=2)
+
+        self.assertEqual(expected, result)
+
+    def test_split_parallel_serialization(self):
+        parent = ModelSimpleParent.objects.create(name='Parent')
+        ModelChild.objects.bulk_create(ModelChild(name=f'Child{i}', related=parent) for i in range(10))
+
+        expected = ChildSerializer().serialize('split')
+
+        result = ChildSerializer().parallel_serialize('split', workers=3)
+
+        self.assertEqual(expected, result)
+
+    def test_sparse_record_parallel_serialization(self):
+        parent = ModelSimpleParent.objects.create(name='Parent')
+        ModelChild.objects.bulk_create(ModelChild(name=f'Child{i}', related=parent) for i in range(10))
+
+        expected = ChildSerializer().serialize('record', only=['name'])
+
+        result = ChildSerializer().sparse(only=['name']).parallel_serialize('record', workers=2)
+
+        self.assertEqual(expected, result)
+
+    def test_unordered_parallel_serialization(self):
+        queryset = BasicModel.objects.filter(name__endswith='1')
+        expected = BasicSerializer(queryset).serialize('normal')
+
+        chunks = BasicSerializer(queryset).iter_parallel_serialize('normal', workers=2, ordered=False)
+        result = [row for chunk in chunks for row in chunk]
+
+        self.assertCountEqual(expected, result)
+
+    def test_ordered_parallel_serialization_follows_the_pk(self):
+        queryset = BasicModel.objects.order_by('-pk')
+        expected = BasicSerializer(queryset).serialize('normal')
+
+        self.assertEqual(expected, BasicSerializer(queryset).parallel_serialize('normal', workers=2))
+
+        with self.assertRaises(Exception):
+            BasicSerializer(BasicModel.objects.order_by('-name')).parallel_serialize('normal', workers=2)
+
+        queryset = BasicModel.objects.order_by('-name')
+        chunks = BasicSerializer(queryset).iter_parallel_serialize('normal', workers=2, ordered=False)
+        self.assertCountEqual(BasicSerializer(queryset).serialize('normal'), [row for chunk in chunks for row in chunk])
+
+    def test_parallel_serialization_inside_transaction(self):
+        with transaction.atomic(), self.assertRaises(Exception):
+            BasicSerializer().parallel_serialize('normal', workers=2)